@@ -0,0 +1,93 @@
+"""Benchmark the iteration speeds of the solvers on tic-tac-toe.
+
+Run ``python benchmarks/iterations.py`` from the repository root. Pass
+``--cache`` with a directory to reuse the compiled game across runs.
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any
+import warnings
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+
+    from gpugt.algorithms.counterfactual_regret_minimization import (
+        Backend,
+        CounterfactualRegretMinimization,
+        Variant,
+    )
+    from gpugt.algorithms.monte_carlo_counterfactual_regret_minimization \
+        import MonteCarloCounterfactualRegretMinimization, Sampling
+
+from gpugt.caches import DiskCache
+from gpugt.games.tic_tac_toe import create_tic_tac_toe
+
+CONFIGURATIONS: list[tuple[type[Any], dict[str, Any]]] = [
+    (
+        CounterfactualRegretMinimization,
+        {
+            'variant': Variant.PLUS,
+            'alternating_updates': alternating_updates,
+            'pruning': pruning,
+        },
+    )
+    for alternating_updates in (True, False)
+    for pruning in (False, True)
+] + [
+    (
+        MonteCarloCounterfactualRegretMinimization,
+        {'sampling': sampling, 'seed': 0},
+    )
+    for sampling in Sampling
+]
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+
+    parser.add_argument('--backend', choices=Backend.__members__)
+    parser.add_argument('--cache')
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=30)
+
+    args = parser.parse_args()
+    backends = (
+        list(Backend) if args.backend is None else [Backend[args.backend]]
+    )
+    cache = None if args.cache is None else DiskCache(args.cache, 2 ** 40)
+
+    game: Any
+
+    if cache is None:
+        game = create_tic_tac_toe()
+    else:
+        game = cache.get_game(create_tic_tac_toe)
+
+    for backend in backends:
+        for solver_type, kwargs in CONFIGURATIONS:
+            solver = solver_type(game, backend=backend, cache=cache, **kwargs)
+
+            for _ in range(args.warmup):
+                solver.iterate()
+
+            start_time = perf_counter()
+
+            for _ in range(args.iterations):
+                solver.iterate()
+
+            speed = args.iterations / (perf_counter() - start_time)
+            settings = ' '.join(
+                f'{key}={getattr(value, "name", value)}'
+                for key, value in kwargs.items()
+            )
+
+            print(
+                f'{backend.name:8}{solver_type.__name__:46}{settings:60}'
+                f'{speed:8.1f} it/s',
+                flush=True,
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+""":mod:`gpugt.algorithms.array_policy` defines array-backed policies."""
+
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Generic, TypeVar
+
+_V = TypeVar('_V', bound=Hashable)
+
+
+@dataclass(frozen=True)
+class ArrayPolicy(Generic[_V]):
+    """An implementation of array-backed policies.
+
+    The probability of each action, including those of nature, is the
+    array element at the index of the node the action leads to. The
+    evaluation algorithms accept this class in place of a callable
+    strategy profile, and look the probabilities up without a call per
+    action.
+
+    This class is only an adapter for the label-based evaluation
+    algorithms, which still look up each node by its label. The
+    probabilities are copied to a host list once, so the lookups are
+    plain list indexing. Tensor code should index :attr:`probabilities`
+    with index arrays instead.
+
+    :param nodes: The indices of the nodes.
+    :param probabilities: The probabilities of the actions leading to
+                          the nodes.
+    """
+
+    nodes: Mapping[_V, int]
+    """The indices of the nodes."""
+    probabilities: Any
+    """The probabilities of the actions leading to the nodes."""
+
+    @cached_property
+    def _probabilities(self) -> list[float]:
+        probabilities: list[float] = self.probabilities.tolist()
+
+        return probabilities
+
+    def get_probabilities(self, nodes: Iterable[_V]) -> list[float]:
+        """Return the probabilities of the actions leading to the nodes.
+
+        :param nodes: The nodes.
+        :return: The probabilities.
+        """
+        return [self._probabilities[self.nodes[node]] for node in nodes]
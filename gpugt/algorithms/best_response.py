@@ -9,8 +9,11 @@ from math import isclose
 from operator import mul
 from typing import Generic, TypeVar
 
+from gpugt.algorithms.array_policy import ArrayPolicy
 from gpugt.functools2 import cached_method
+from gpugt.games.compact_game import CompactGame
 from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
+from gpugt.graphs.traversals import post_order, pre_order
 
 _V = TypeVar('_V', bound=Hashable)
 _H = TypeVar('_H', bound=Hashable)
@@ -22,13 +25,19 @@ _I = TypeVar('_I', bound=Hashable)
 class BestResponse(Generic[_V, _H, _A, _I]):
     """An implementation of best response.
 
-    :param game: The finite extensive-form game.
-    :param strategy_profile: The strategy profile.
+    :param game: The finite extensive-form game, either a
+                 :class:`FiniteExtensiveFormGame` or a
+                 :class:`CompactGame`.
+    :param strategy_profile: The strategy profile, either a callable
+                             or an array-backed policy.
     :param player: The best responder.
     """
 
-    game: FiniteExtensiveFormGame[_V, _H, _A, _I]
-    strategy_profile: Callable[[_V, _A], float]
+    game: (
+        FiniteExtensiveFormGame[_V, _H, _A, _I]
+        | CompactGame[_V, _H, _A, _I]
+    )
+    strategy_profile: Callable[[_V, _A], float] | ArrayPolicy[_V]
     player: _I
     nodes: defaultdict[_H, list[_V]] = field(
         init=False,
@@ -42,6 +51,10 @@ class BestResponse(Generic[_V, _H, _A, _I]):
         init=False,
         default_factory=dict,
     )
+    expected_payoffs: dict[_V, float] = field(
+        init=False,
+        default_factory=dict,
+    )
 
     def __post_init__(self) -> None:
         for node in self.game.nodes:
@@ -55,51 +68,53 @@ class BestResponse(Generic[_V, _H, _A, _I]):
                 action = self.game.action_partition[node]
                 self.successors[predecessor, action] = node
 
-        self._dfs(self.game.initial_node)
+        for node, counterfactual_reach_probability in pre_order(
+                (self.game.initial_node, 1.0),
+                self._get_successor_reach_probabilities,
+        ):
+            self.counterfactual_reach_probabilities[node] = (
+                counterfactual_reach_probability
+            )
 
-    def _dfs(
+    def _get_successor_reach_probabilities(
             self,
-            node: _V,
-            counterfactual_reach_probability: float = 1,
-    ) -> None:
-        self.counterfactual_reach_probabilities[node] = (
-            counterfactual_reach_probability
-        )
+            item: tuple[_V, float],
+    ) -> list[tuple[_V, float]]:
+        node, counterfactual_reach_probability = item
 
         if node in self.game.terminal_nodes:
-            pass
+            return []
         elif node in self.game.decision_nodes:
             information_set = self.game.information_partition[node]
             player = self.game.player_partition[information_set]
             successors = tuple(self.game.successors[node])
 
             if player == self.player:
-                probabilities = [1] * len(successors)
+                probabilities = [1.0] * len(successors)
             else:
-                actions = tuple(
-                    map(self.game.action_partition.__getitem__, successors),
-                )
-                probabilities = list(
-                    map(
-                        partial(  # type: ignore[arg-type]
-                            self.strategy_profile,
-                            node,
-                        ),
-                        actions,
-                    ),
-                )
+                probabilities = self._get_probabilities(node, successors)
 
-            for successor, probability in zip(
-                    self.game.successors[node],
-                    probabilities,
-            ):
-                self._dfs(
-                    successor,
-                    counterfactual_reach_probability * probability,
-                )
+            return [
+                (successor, counterfactual_reach_probability * probability)
+                for successor, probability in zip(successors, probabilities)
+            ]
         else:
             raise AssertionError
 
+    def _get_probabilities(
+            self,
+            node: _V,
+            successors: tuple[_V, ...],
+    ) -> list[float]:
+        if isinstance(self.strategy_profile, ArrayPolicy):
+            return self.strategy_profile.get_probabilities(successors)
+
+        actions = tuple(
+            map(self.game.action_partition.__getitem__, successors),
+        )
+
+        return list(map(partial(self.strategy_profile, node), actions))
+
     def _verify_information_set(self, information_set: _H) -> None:
         player = self.game.player_partition[information_set]
 
@@ -133,13 +148,46 @@ class BestResponse(Generic[_V, _H, _A, _I]):
 
         return action == self.get_best_action(information_set)
 
+    def _get_dependencies(self, node: _V) -> list[_V]:
+        if (
+                node in self.expected_payoffs
+                or node not in self.game.decision_nodes
+        ):
+            return []
+
+        information_set = self.game.information_partition[node]
+        player = self.game.player_partition[information_set]
+
+        if player == self.player:
+            nodes = self.nodes[information_set]
+        else:
+            nodes = [node]
+
+        return [
+            successor
+            for node in nodes
+            for successor in self.game.successors[node]
+            if successor not in self.expected_payoffs
+        ]
+
     @cached_method
     def get_expected_payoff(self, node: _V) -> float:
+        for node_ in post_order(node, self._get_dependencies):
+            if node_ not in self.expected_payoffs:
+                self.expected_payoffs[node_] = (
+                    self._calculate_expected_payoff(node_)
+                )
+
+        return self.expected_payoffs[node]
+
+    def _calculate_expected_payoff(self, node: _V) -> float:
         if node in self.game.terminal_nodes:
             expected_payoff = self.game.payoffs[node][self.player]
         elif node in self.game.decision_nodes:
             successors = tuple(self.game.successors[node])
-            expected_payoffs = tuple(map(self.get_expected_payoff, successors))
+            expected_payoffs = tuple(
+                map(self.expected_payoffs.__getitem__, successors),
+            )
             information_set = self.game.information_partition[node]
             player = self.game.player_partition[information_set]
             actions = tuple(
@@ -154,11 +202,9 @@ class BestResponse(Generic[_V, _H, _A, _I]):
                     ),
                 )
             else:
-                probabilities = list(
-                    map(partial(self.strategy_profile, node), actions),
-                )
+                probabilities = self._get_probabilities(node, successors)
 
-            assert isclose(sum(probabilities), 1)
+            assert isclose(sum(probabilities), 1, rel_tol=1e-5)
 
             expected_payoff = sum(
                 starmap(mul, zip(expected_payoffs, probabilities)),
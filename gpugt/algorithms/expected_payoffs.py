@@ -2,14 +2,17 @@
 calculation.
 """
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Hashable, Iterable
 from collections import defaultdict
 from dataclasses import dataclass, field
 from functools import partial
 from operator import getitem
 from typing import Generic, TypeVar
 
+from gpugt.algorithms.array_policy import ArrayPolicy
+from gpugt.games.compact_game import CompactGame
 from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
+from gpugt.graphs.traversals import post_order
 
 _V = TypeVar('_V', bound=Hashable)
 _H = TypeVar('_H', bound=Hashable)
@@ -21,35 +24,54 @@ _I = TypeVar('_I', bound=Hashable)
 class ExpectedPayoffs(Generic[_V, _H, _A, _I]):
     """An implementation of expected payoffs calculation.
 
-    :param game: The finite extensive-form game.
-    :param strategy_profile: The strategy profile.
+    :param game: The finite extensive-form game, either a
+                 :class:`FiniteExtensiveFormGame` or a
+                 :class:`CompactGame`.
+    :param strategy_profile: The strategy profile, either a callable
+                             or an array-backed policy.
     """
 
-    game: FiniteExtensiveFormGame[_V, _H, _A, _I]
-    strategy_profile: Callable[[_V, _A], float]
+    game: (
+        FiniteExtensiveFormGame[_V, _H, _A, _I]
+        | CompactGame[_V, _H, _A, _I]
+    )
+    strategy_profile: Callable[[_V, _A], float] | ArrayPolicy[_V]
     expected_payoffs: defaultdict[_V, defaultdict[_I, float]] = field(
         init=False,
         default_factory=partial(defaultdict, partial(defaultdict, float)),
     )
 
     def __post_init__(self) -> None:
-        self._dfs(self.game.initial_node)
+        for node in post_order(self.game.initial_node, self._get_successors):
+            self._update(node)
+
+    def _get_successors(self, node: _V) -> tuple[_V, ...]:
+        if node in self.game.decision_nodes:
+            return tuple(self.game.successors[node])
 
-    def _dfs(self, node: _V) -> None:
+        return ()
+
+    def _update(self, node: _V) -> None:
         if node in self.game.terminal_nodes:
             self.expected_payoffs[node].update(self.game.payoffs[node])
         elif node in self.game.decision_nodes:
             successors = tuple(self.game.successors[node])
-            actions = tuple(
-                map(partial(getitem, self.game.action_partition), successors),
-            )
-
-            for successor in successors:
-                self._dfs(successor)
+            probabilities: Iterable[float]
 
-            probabilities = tuple(
-                map(partial(self.strategy_profile, node), actions),
-            )
+            if isinstance(self.strategy_profile, ArrayPolicy):
+                probabilities = self.strategy_profile.get_probabilities(
+                    successors,
+                )
+            else:
+                actions = tuple(
+                    map(
+                        partial(getitem, self.game.action_partition),
+                        successors,
+                    ),
+                )
+                probabilities = tuple(
+                    map(partial(self.strategy_profile, node), actions),
+                )
 
             for successor, probability in zip(successors, probabilities):
                 for player, expected_payoff in (
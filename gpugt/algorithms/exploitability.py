@@ -5,8 +5,10 @@ from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 from statistics import mean
 
+from gpugt.algorithms.array_policy import ArrayPolicy
 from gpugt.algorithms.best_response import BestResponse
 from gpugt.algorithms.expected_payoffs import ExpectedPayoffs
+from gpugt.games.compact_game import CompactGame
 from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
 
 _V = TypeVar('_V', bound=Hashable)
@@ -19,12 +21,18 @@ _I = TypeVar('_I', bound=Hashable)
 class Exploitability(Generic[_V, _H, _A, _I]):
     """An implementation of exploitability calculation.
 
-    :param game: The finite extensive-form game.
-    :param strategy_profile: The strategy profile.
+    :param game: The finite extensive-form game, either a
+                 :class:`FiniteExtensiveFormGame` or a
+                 :class:`CompactGame`.
+    :param strategy_profile: The strategy profile, either a callable
+                             or an array-backed policy.
     """
 
-    game: FiniteExtensiveFormGame[_V, _H, _A, _I]
-    strategy_profile: Callable[[_V, _A], float]
+    game: (
+        FiniteExtensiveFormGame[_V, _H, _A, _I]
+        | CompactGame[_V, _H, _A, _I]
+    )
+    strategy_profile: Callable[[_V, _A], float] | ArrayPolicy[_V]
     expected_payoffs: ExpectedPayoffs[_V, _H, _A, _I] = field(init=False)
     best_responses: dict[_I, BestResponse[_V, _H, _A, _I]] = field(
         init=False,
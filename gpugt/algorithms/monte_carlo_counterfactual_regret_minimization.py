@@ -0,0 +1,528 @@
+""":mod:`gpugt.algorithms.monte_carlo_counterfactual_regret_minimization`
+defines Monte Carlo counterfactual regret minimization.
+"""
+
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from enum import auto, Enum
+from typing import Any, TypeVar
+
+try:
+    import cupy as cp  # type: ignore[import-untyped]
+except ImportError:
+    import numpy as cp
+
+import numpy as np
+
+from gpugt.algorithms.counterfactual_regret_minimization import (
+    _get_children,
+    _get_segment_ids,
+    CounterfactualRegretMinimization,
+)
+
+_V = TypeVar('_V', bound=Hashable)
+_H = TypeVar('_H', bound=Hashable)
+_A = TypeVar('_A', bound=Hashable)
+_I = TypeVar('_I', bound=Hashable)
+
+
+class Sampling(Enum):
+    """An enum of Monte Carlo counterfactual regret minimization
+    sampling schemes.
+    """
+
+    EXTERNAL = auto()
+    """External sampling.
+
+    A single action is sampled at every node of the opponents and
+    nature, while all the actions of the updated player are explored.
+    The average strategy profiles of the opponents are updated.
+    """
+    OUTCOME = auto()
+    """Outcome sampling.
+
+    A single action is sampled at every node, those of the updated
+    player with the exploration, so that a single terminal history is
+    evaluated. The regrets are importance-weighted by the inverse
+    sampling probabilities. The average strategy profiles of the
+    opponents are updated.
+    """
+    CHANCE = auto()
+    """Chance sampling.
+
+    A batch of outcomes is sampled at every nature information set and
+    the probabilities of the nature actions are replaced by their
+    frequencies in the batch, while all the actions of the players are
+    explored. The average strategy profiles of the updated players are
+    updated. Unlike in the other schemes, the players may be updated
+    simultaneously.
+    """
+
+
+@dataclass
+class MonteCarloCounterfactualRegretMinimization(
+        CounterfactualRegretMinimization[_V, _H, _A, _I],
+):
+    """An implementation of Monte Carlo counterfactual regret
+    minimization.
+
+    Every iteration visits only the sampled subtrees. The sampled nodes
+    are gathered level by level from the root, together with their
+    sampling weights, and the reach probabilities, the strategies, and
+    the expected payoffs are computed only at them. The regrets and the
+    reach probabilities of the average strategy profile are unbiased
+    estimates of those of :class:`CounterfactualRegretMinimization`.
+    As the unsampled subtrees are never visited, pruning has no effect.
+
+    Except in chance sampling, the players are always updated in turn.
+
+    :param game: The finite extensive-form game, either a
+                 :class:`FiniteExtensiveFormGame` or a
+                 :class:`CompactGame`.
+    :param sampling: The sampling scheme, defaults to external sampling.
+    :param exploration: The probability with which the actions of the
+                        updated player are sampled uniformly in outcome
+                        sampling, defaults to ``0.6``.
+    :param batch_size: The number of outcomes sampled at every nature
+                       information set in chance sampling, defaults to
+                       ``1``.
+    :param seed: The optional seed of the random number generator.
+    :raises ValueError: If the updates are not alternating outside
+                        chance sampling, the exploration is not between
+                        ``0`` and ``1``, or the batch size is not
+                        positive.
+    """
+
+    alternating_updates: bool = True
+    """Whether to update the players in turn instead of simultaneously.
+    """
+    sampling: Sampling = Sampling.EXTERNAL
+    """The sampling scheme."""
+    exploration: float = 0.6
+    """The exploration probability of outcome sampling."""
+    batch_size: int = 1
+    """The number of outcomes per nature information set of chance
+    sampling.
+    """
+    seed: int | None = None
+    """The optional seed of the random number generator."""
+
+    def __post_init__(self) -> None:
+        if self.sampling != Sampling.CHANCE and not self.alternating_updates:
+            raise ValueError('non-alternating updates')
+        elif not 0 <= self.exploration <= 1:
+            raise ValueError('exploration not between 0 and 1')
+        elif self.batch_size <= 0:
+            raise ValueError('non-positive batch size')
+
+        super().__post_init__()
+
+    _random_number_generator: Any = field(init=False)
+    _node_actions: Any = field(init=False)
+    _node_players: Any = field(init=False)
+    _internal_node_mask: Any = field(init=False)
+    _action_information_sets: Any = field(init=False)
+    _nature_action_probabilities: Any = field(init=False)
+    _nature_action_offsets: Any = field(init=False)
+    _nature_action_segment_ids: Any = field(init=False)
+    _node_nature_actions: Any = field(init=False)
+
+    def _setup_nature_samples(self) -> None:
+        nature_actions = dict[tuple[_H, _A], int]()
+        nature_action_probabilities = list[float]()
+        nature_action_offsets = list[int]()
+
+        for information_set in self.game.nature_information_sets:
+            nature_action_offsets.append(len(nature_actions))
+
+            for action, probability in (
+                    self.game.nature_probabilities[information_set].items()
+            ):
+                nature_actions[information_set, action] = len(nature_actions)
+
+                nature_action_probabilities.append(probability)
+
+        node_nature_actions = np.full(len(self.nodes), -1, dtype=np.intp)
+
+        for node, v in self._nodes.items():
+            if node == self.game.initial_node:
+                continue
+
+            information_set = self.game.information_partition[
+                self.game.predecessors[node]
+            ]
+            action = self.game.action_partition[node]
+
+            if (information_set, action) in nature_actions:
+                node_nature_actions[v] = nature_actions[
+                    information_set,
+                    action,
+                ]
+
+        self._nature_action_probabilities = cp.asarray(
+            nature_action_probabilities,
+            dtype=self.dtype,
+        )
+        self._nature_action_offsets = cp.asarray(
+            nature_action_offsets,
+            dtype=cp.intp,
+        )
+        self._nature_action_segment_ids = _get_segment_ids(
+            cp.append(self._nature_action_offsets, len(nature_actions)),
+        )
+        self._node_nature_actions = cp.asarray(node_nature_actions)
+
+    def _setup_iteration(self) -> None:
+        if self.sampling == Sampling.CHANCE:
+            self._setup_nature_samples()
+
+        self._random_number_generator = cp.random.default_rng(self.seed)
+        transposed_action_node_mask = self._transposed_action_node_mask
+        self._node_actions = cp.full(len(self.nodes), -1, dtype=cp.intp)
+        self._node_actions[cp.diff(transposed_action_node_mask.indptr) > 0] = (
+            transposed_action_node_mask.indices
+        )
+        self._node_players = cp.where(
+            self._node_player_mask.any(1),
+            self._node_player_mask.argmax(1),
+            -1,
+        )
+        self._internal_node_mask = cp.concatenate(
+            [
+                *(
+                    cp.diff(level_graph.indptr) > 0
+                    for level_graph in self._level_graphs
+                ),
+                cp.zeros(
+                    self._levels[-1].stop - self._levels[-1].start,
+                    dtype=cp.bool_,
+                ),
+            ],
+        )
+        self._action_information_sets = _get_segment_ids(
+            self._information_set_action_mask.indptr,
+        )
+
+        super()._setup_iteration()
+
+        self._iteration_steps = (
+            self._calculate_update_indices,
+            self._calculate_samples,
+            self._calculate_sampled_expected_payoffs,
+            self._calculate_average_strategy_profile,
+            self._calculate_next_strategy_profile,
+        )
+
+    def _get_sampled_nature_action_probabilities(self) -> Any:
+        keys = self._random_number_generator.standard_exponential(
+            (self.batch_size, len(self._nature_action_probabilities)),
+            dtype=self.dtype,
+        )
+        positive_mask = self._nature_action_probabilities > 0
+        keys[:, ~positive_mask] = cp.inf
+
+        cp.divide(
+            keys,
+            self._nature_action_probabilities,
+            out=keys,
+            where=positive_mask,
+        )
+
+        key_minima = cp.minimum.reduceat(
+            keys,
+            self._nature_action_offsets,
+            axis=1,
+        )
+        samples = keys == key_minima[:, self._nature_action_segment_ids]
+
+        return samples.sum(0) / self.batch_size
+
+    def _get_sampling_weights(
+            self,
+            children: Any,
+            segment_ids: Any,
+            child_offsets: Any,
+            players: Any,
+            actions: Any,
+            strategies: Any,
+            updated_mask: Any,
+            nature_action_probabilities: Any,
+    ) -> Any:
+        sampling_weights = cp.ones(len(children), dtype=self.dtype)
+
+        if self.sampling == Sampling.CHANCE:
+            nature_mask = players < 0
+            sampling_weights[nature_mask] = 0
+            nature_edges = cp.flatnonzero(nature_mask & (strategies > 0))
+            sampling_weights[nature_edges] = (
+                nature_action_probabilities[
+                    self._node_nature_actions[children[nature_edges]]
+                ]
+                / strategies[nature_edges]
+            )
+
+            return sampling_weights
+
+        sampling_probabilities = strategies
+
+        if self.sampling == Sampling.OUTCOME:
+            sampling_probabilities = cp.where(
+                updated_mask,
+                (
+                    self.exploration
+                    * self._default_strategy_profile[actions]
+                    + (1 - self.exploration) * strategies
+                ),
+                strategies,
+            )
+
+        keys = cp.full(len(children), cp.inf, dtype=self.dtype)
+
+        cp.divide(
+            self._random_number_generator.standard_exponential(
+                len(children),
+                dtype=self.dtype,
+            ),
+            sampling_probabilities,
+            out=keys,
+            where=sampling_probabilities > 0,
+        )
+
+        samples = keys == cp.minimum.reduceat(keys, child_offsets[:-1])[
+            segment_ids
+        ]
+
+        if self.sampling == Sampling.EXTERNAL:
+            samples |= updated_mask
+            sampling_probabilities = cp.where(
+                updated_mask,
+                1,
+                sampling_probabilities,
+            )
+
+        sampling_weights.fill(0)
+        cp.divide(
+            1,
+            sampling_probabilities,
+            out=sampling_weights,
+            where=samples,
+        )
+
+        return sampling_weights
+
+    _averaged_players: list[int] = field(init=False)
+    _sampled_levels: list[tuple[Any, ...]] = field(init=False)
+    _sampled_information_sets: list[Any] = field(init=False)
+    _sampled_reach_probability_terms: list[Any] = field(init=False)
+
+    def _calculate_samples(self) -> None:
+        c = self._columns
+        start, stop, _ = c.indices(len(self.players))
+
+        if self.sampling == Sampling.CHANCE:
+            self._averaged_players = list(range(start, stop))
+            nature_action_probabilities = (
+                self._get_sampled_nature_action_probabilities()
+            )
+        else:
+            self._averaged_players = [
+                j for j in range(len(self.players)) if j != start
+            ]
+            nature_action_probabilities = None
+
+        columns = cp.arange(start, stop)
+        averaged_players = cp.asarray(self._averaged_players, dtype=cp.intp)
+        nodes = cp.flatnonzero(self._internal_node_mask[:1])
+        counterfactual_reach_probabilities = cp.ones(
+            (len(nodes), stop - start),
+            dtype=self.dtype,
+        )
+        reach_probabilities = cp.ones(
+            (len(nodes), len(self._averaged_players)),
+            dtype=self.dtype,
+        )
+        self._sampled_levels = []
+        self._sampled_information_sets = []
+        self._sampled_reach_probability_terms = []
+
+        for level, next_level, level_graph in zip(
+                self._levels,
+                self._levels[1:],
+                self._level_graphs,
+        ):
+            if not len(nodes):
+                break
+
+            children, segment_ids, child_offsets = _get_children(
+                level_graph.indptr,
+                nodes - level.start,
+            )
+            children += next_level.start
+            players = self._node_players[children]
+            actions = self._node_actions[children]
+            strategies = cp.where(
+                players >= 0,
+                self._strategy_profile[actions],
+                self._nature_strategies[children],
+            )
+            updated_mask = (players >= start) & (players < stop)
+            sampling_weights = self._get_sampling_weights(
+                children,
+                segment_ids,
+                child_offsets,
+                players,
+                actions,
+                strategies,
+                updated_mask,
+                nature_action_probabilities,
+            )
+            sampled_strategies = sampling_weights * strategies
+            averaged_mask = players[:, None] == averaged_players
+            averaged_edges, averaged_player_indices = cp.nonzero(
+                averaged_mask,
+            )
+
+            self._sampled_information_sets.append(
+                self._action_information_sets[actions[averaged_edges]],
+            )
+            self._sampled_reach_probability_terms.append(
+                reach_probabilities[
+                    segment_ids[averaged_edges],
+                    averaged_player_indices,
+                ]
+                * strategies[averaged_edges],
+            )
+            self._sampled_levels.append(
+                (
+                    nodes,
+                    children,
+                    segment_ids,
+                    child_offsets,
+                    players,
+                    actions,
+                    sampling_weights,
+                    sampled_strategies,
+                    updated_mask,
+                    counterfactual_reach_probabilities,
+                ),
+            )
+
+            next_mask = sampling_weights > 0
+            next_mask &= self._internal_node_mask[children]
+            next_edges = cp.flatnonzero(next_mask)
+            nodes = children[next_edges]
+            counterfactual_reach_probabilities = (
+                counterfactual_reach_probabilities[segment_ids[next_edges]]
+                * cp.where(
+                    players[next_edges, None] == columns,
+                    sampling_weights[next_edges, None],
+                    sampled_strategies[next_edges, None],
+                )
+            )
+            reach_probabilities = (
+                reach_probabilities[segment_ids[next_edges]]
+                * cp.where(
+                    averaged_mask[next_edges],
+                    sampled_strategies[next_edges, None],
+                    sampling_weights[next_edges, None],
+                )
+            )
+
+    _sampled_actions: list[Any] = field(init=False)
+    _sampled_regrets: list[Any] = field(init=False)
+
+    def _calculate_sampled_expected_payoffs(self) -> None:
+        c = self._columns
+        start = c.indices(len(self.players))[0]
+        next_expected_payoffs = None
+        self._sampled_actions = []
+        self._sampled_regrets = []
+
+        for (
+                nodes,
+                children,
+                segment_ids,
+                child_offsets,
+                players,
+                actions,
+                sampling_weights,
+                sampled_strategies,
+                updated_mask,
+                counterfactual_reach_probabilities,
+        ) in reversed(self._sampled_levels):
+            child_expected_payoffs = self._initial_expected_payoffs[
+                children,
+                c,
+            ]
+
+            if next_expected_payoffs is not None:
+                next_mask = sampling_weights > 0
+                next_mask &= self._internal_node_mask[children]
+                child_expected_payoffs[next_mask] = next_expected_payoffs
+
+            expected_payoffs = self._initial_expected_payoffs[nodes, c]
+            expected_payoffs += cp.add.reduceat(
+                sampled_strategies[:, None] * child_expected_payoffs,
+                child_offsets[:-1],
+                axis=0,
+            )
+            updated_edges = cp.flatnonzero(updated_mask)
+            updated_segment_ids = segment_ids[updated_edges]
+            updated_columns = players[updated_edges] - start
+
+            self._sampled_actions.append(actions[updated_edges])
+            self._sampled_regrets.append(
+                counterfactual_reach_probabilities[
+                    updated_segment_ids,
+                    updated_columns,
+                ]
+                * (
+                    sampling_weights[updated_edges]
+                    * child_expected_payoffs[updated_edges, updated_columns]
+                    - expected_payoffs[updated_segment_ids, updated_columns]
+                ),
+            )
+
+            next_expected_payoffs = expected_payoffs
+
+    def _calculate_average_strategy_profile(self) -> None:
+        reach_probabilities = cp.bincount(
+            cp.concatenate(
+                [cp.zeros(0, dtype=cp.intp), *self._sampled_information_sets],
+            ),
+            cp.concatenate(
+                [
+                    cp.zeros(0, dtype=self.dtype),
+                    *self._sampled_reach_probability_terms,
+                ],
+            ),
+            len(self.information_sets),
+        )
+        i = self._columns.indices(len(self.players))[0]
+
+        for j in self._averaged_players:
+            h = self._player_information_sets[j]
+
+            if self.sampling == Sampling.CHANCE:
+                discounted = True
+            else:
+                discounted = i == (1 if j == 0 else 0)
+
+            self._update_average_strategy_profile(
+                h,
+                self._player_actions[j],
+                self._player_transposed_information_set_action_masks[j],
+                reach_probabilities[h],
+                discounted,
+            )
+
+    def _calculate_instantaneous_counterfactual_regrets(self) -> None:
+        self._instantaneous_counterfactual_regrets[...] = cp.bincount(
+            cp.concatenate(
+                [cp.zeros(0, dtype=cp.intp), *self._sampled_actions],
+            ),
+            cp.concatenate(
+                [cp.zeros(0, dtype=self.dtype), *self._sampled_regrets],
+            ),
+            len(self.actions),
+        )
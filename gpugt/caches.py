@@ -0,0 +1,247 @@
+""":mod:`gpugt.caches` defines the disk cache of built games and
+compiled tensors.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from hashlib import sha256
+from os import PathLike, remove, replace, scandir, utime
+from pathlib import Path
+from pkgutil import resolve_name
+from tempfile import mkstemp
+from types import CodeType
+from typing import Any
+import pickle
+
+from gpugt.games.compact_game import CompactGame
+from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
+
+_SUFFIXES = '.game', '.pickle'
+
+
+def _normalize_constant(value: Any) -> Any:
+    if isinstance(value, CodeType):
+        return _get_code_digest(value)
+    elif isinstance(value, frozenset):
+        return tuple(sorted(map(repr, map(_normalize_constant, value))))
+    elif isinstance(value, tuple):
+        return tuple(map(_normalize_constant, value))
+
+    return value
+
+
+def _get_code_digest(code: CodeType) -> str:
+    constants = _normalize_constant(code.co_consts)
+
+    return sha256(code.co_code + repr(constants).encode()).hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return repr(value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__qualname__,
+            tuple(
+                (field.name, _normalize(getattr(value, field.name)))
+                for field in fields(value)
+                if field.init
+            ),
+        )
+    elif isinstance(value, Mapping):
+        return tuple(
+            (_normalize(key), _normalize(value[key])) for key in value
+        )
+    elif isinstance(value, (set, frozenset)):
+        return tuple(sorted(map(repr, map(_normalize, value))))
+    elif isinstance(value, (list, tuple)):
+        return tuple(map(_normalize, value))
+    elif callable(value):
+        module = getattr(value, '__module__', None)
+        qualname = getattr(value, '__qualname__', None)
+
+        try:
+            resolved_value = resolve_name(f'{module}:{qualname}')
+        except (AttributeError, ImportError, ValueError):
+            resolved_value = None
+
+        if resolved_value is not value:
+            raise TypeError('callable not importable by name')
+
+        code = getattr(value, '__code__', None)
+
+        if code is None:
+            return f'{module}.{qualname}'
+
+        return (
+            f'{module}.{qualname}',
+            _get_code_digest(code),
+            _normalize(getattr(value, '__defaults__', None)),
+            _normalize(getattr(value, '__kwdefaults__', None)),
+        )
+
+    return repr(value)
+
+
+def get_key(*values: Any) -> str:
+    """Return the content-addressed key of values.
+
+    The dataclasses (such as PokerKit states) are keyed by their
+    initialization fields, the callables (such as amount factories) by
+    their qualified names, and the other values by their
+    representations (such as OpenSpiel game strings), so the keys are
+    stable across processes. The functions are also keyed by their
+    bytecode, constants, and default arguments, so editing a builder
+    invalidates its entries.
+
+    Only the callables importable by their qualified names, such as
+    module-level functions, can be keyed. Lambdas, closures, partials,
+    and bound methods cannot, as their names do not identify them.
+
+    :param values: The values.
+    :return: The key.
+    :raises TypeError: If a callable is not importable by its qualified
+                       name.
+    """
+    return sha256(repr(_normalize(values)).encode()).hexdigest()
+
+
+@dataclass
+class DiskCache:
+    """An implementation of content-addressed disk caches.
+
+    The entries are files in a directory named by their keys. Whenever
+    an entry is added, the least recently used entries are evicted
+    until the total size of the entries is within the maximum size.
+
+    :param directory: The directory of the entries.
+    :param max_size: The maximum total size of the entries in bytes.
+    :raises ValueError: If the maximum size is not positive.
+    """
+
+    directory: str | PathLike[str]
+    """The directory of the entries."""
+    max_size: int
+    """The maximum total size of the entries in bytes."""
+
+    def __post_init__(self) -> None:
+        if self.max_size <= 0:
+            raise ValueError('non-positive maximum size')
+
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+
+    def _get_path(self, key: str, suffix: str) -> Path:
+        return Path(self.directory, f'{key}{suffix}')
+
+    def _touch(self, path: Path) -> bool:
+        try:
+            utime(path)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def evict(self) -> None:
+        """Evict the least recently used entries until the total size
+        of the entries is within the maximum size.
+
+        Only the game and object entries are counted, so other files in
+        the directory, such as partially written ones, are left alone.
+
+        :return: ``None``.
+        """
+        entries = []
+
+        for entry in scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(_SUFFIXES):
+                status = entry.stat()
+
+                entries.append((status.st_mtime, status.st_size, entry.path))
+
+        entries.sort()
+
+        size = sum(size for _, size, _ in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+
+            Path(path).unlink(missing_ok=True)
+
+            size -= entry_size
+
+    def get_game(
+            self,
+            builder: Callable[..., Any],
+            *args: Any,
+            **kwargs: Any,
+    ) -> CompactGame[Any, Any, Any, Any]:
+        """Return a built game from the cache, building it on a miss.
+
+        The game is keyed by the builder and its arguments (see
+        :func:`get_key`), saved as a compact game, and loaded memory
+        mapped.
+
+        :param builder: The game builder, such as
+                        :func:`gpugt.games.pokerkit.create_pokerkit`.
+        :param args: The positional arguments of the builder.
+        :param kwargs: The keyword arguments of the builder.
+        :return: The game.
+        :raises TypeError: If the builder or a callable argument is not
+                           importable by its qualified name.
+        """
+        path = self._get_path(
+            get_key(builder, args, sorted(kwargs.items())),
+            '.game',
+        )
+
+        if not self._touch(path):
+            game: CompactGame[Any, Any, Any, Any] = builder(*args, **kwargs)
+
+            if isinstance(game, FiniteExtensiveFormGame):
+                game = CompactGame.from_finite_extensive_form_game(game)
+
+            game.save(path)
+            self.evict()
+
+            if not path.exists():
+                return game
+
+        return CompactGame.load(path, mmap=True)
+
+    def get_object(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return a pickled object from the cache, creating it on a
+        miss.
+
+        As the objects are pickled, only use trusted directories.
+
+        :param key: The key of the object.
+        :param factory: The function creating the object.
+        :return: The object.
+        """
+        path = self._get_path(key, '.pickle')
+
+        if self._touch(path):
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+
+        value = factory()
+        descriptor, temporary_path = mkstemp(
+            suffix='.tmp',
+            dir=self.directory,
+        )
+
+        try:
+            with open(descriptor, 'wb') as file:
+                pickle.dump(value, file)
+
+            replace(temporary_path, path)
+        except BaseException:
+            remove(temporary_path)
+
+            raise
+
+        self.evict()
+
+        return value
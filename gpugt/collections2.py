@@ -11,6 +11,49 @@ _VT = TypeVar('_VT')
 _T = TypeVar('_T', bound=Hashable)
 
 
+class ArrayMapping(Mapping[_KT, Any]):
+    """An implementation of mappings backed by arrays.
+
+    The value of each key is the array element at the index of the key.
+    The array is not copied.
+
+    :param indices: The indices of the keys.
+    :param array: The array of the values.
+    """
+
+    def __init__(self, indices: Mapping[_KT, int], array: Any) -> None:
+        self.__indices = indices
+        self.__array = array
+
+    @property
+    def indices(self) -> Mapping[_KT, int]:
+        """Return the indices of the keys.
+
+        :return: The indices of the keys.
+        """
+        return self.__indices
+
+    @property
+    def array(self) -> Any:
+        """Return the array of the values.
+
+        :return: The array of the values.
+        """
+        return self.__array
+
+    def __getitem__(self, key: _KT) -> Any:
+        return self.__array[self.__indices[key]].item()
+
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(self.__indices)
+
+    def __len__(self) -> int:
+        return len(self.__indices)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class FrozenOrderedMapping(Mapping[_KT, _VT]):
     """An implementation of frozen ordered mappings.
 
@@ -54,6 +97,9 @@ class FrozenOrderedSet(Set[_T]):
         return len(self.__data)
 
     def __eq__(self, value: object) -> bool:
+        if isinstance(value, FrozenOrderedSet):
+            return self.__data.keys() == value.__data.keys()
+
         return set(self.__data) == value
 
     def __repr__(self) -> str:
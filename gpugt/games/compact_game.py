@@ -0,0 +1,895 @@
+""":mod:`gpugt.games.compact_game` defines the compact array-backed
+finite extensive-form game.
+"""
+
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Set,
+)
+from dataclasses import dataclass, field
+from functools import cached_property
+from hashlib import sha256
+from itertools import count
+from math import prod
+from os import PathLike, remove, replace
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Any, Generic, TypeVar
+import json
+import pickle
+
+import numpy as np
+
+from gpugt.collections2 import FrozenOrderedMapping, FrozenOrderedSet
+from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
+from gpugt.graphs.finite_tree import FiniteTree
+
+_V = TypeVar('_V', bound=Hashable)
+_H = TypeVar('_H', bound=Hashable)
+_A = TypeVar('_A', bound=Hashable)
+_I = TypeVar('_I', bound=Hashable)
+_T = TypeVar('_T')
+_MAGIC = b'\x93GPUGT\x01\x00'
+_ALIGNMENT = 64
+_ARRAY_NAMES = (
+    'parents',
+    'action_ids',
+    'information_set_ids',
+    'player_ids',
+    'chance_probabilities',
+    'payoff_matrix',
+)
+
+
+def _get_padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def _get_index_dtype(count: int) -> Any:
+    if count <= np.iinfo(np.int32).max:
+        return np.int32
+
+    return np.intp
+
+
+class _NodeSet(Set[_V]):
+    def __init__(self, game: CompactGame[_V, Any, Any, Any], mask: Any):
+        self.__game = game
+        self.__mask = mask
+
+    def get_index(self, node: _V) -> int:
+        """Return the index of a node of the set.
+
+        :param node: The node.
+        :return: The index of the node.
+        :raises KeyError: If the node is not a member of the set.
+        :raises TypeError: If the node is unhashable.
+        """
+        v = self.__game.get_node_index(node)
+
+        if not self.__mask[v]:
+            raise KeyError(node)
+
+        return v
+
+    def __contains__(self, o: object) -> bool:
+        try:
+            self.get_index(o)  # type: ignore[arg-type]
+        except (KeyError, TypeError):
+            return False
+
+        return True
+
+    def __iter__(self) -> Iterator[_V]:
+        return map(self.__game.get_node, np.flatnonzero(self.__mask).tolist())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.__mask))
+
+    def __repr__(self) -> str:
+        return '{' + ', '.join(map(repr, self)) + '}'
+
+
+class _NodeMapping(Mapping[_V, _T]):
+    def __init__(self, nodes: _NodeSet[_V], function: Callable[[int], _T]):
+        self.__nodes = nodes
+        self.__function = function
+
+    def __getitem__(self, key: _V) -> _T:
+        try:
+            v = self.__nodes.get_index(key)
+        except TypeError:
+            raise KeyError(key)
+
+        return self.__function(v)
+
+    def __iter__(self) -> Iterator[_V]:
+        return iter(self.__nodes)
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(frozen=True, eq=False)
+class CompactGame(Generic[_V, _H, _A, _I]):
+    """A class for compact array-backed finite extensive-form games.
+
+    The nodes, the information sets, the actions, and the players are
+    identified by their indices, and the structure of the game is held
+    by flat integer and floating-point arrays of the nodes. The labels
+    are kept in side tables, so the conversions from and to
+    :class:`FiniteExtensiveFormGame` are lossless. Without the node
+    labels, the nodes are labelled by their indices.
+
+    The attributes of :class:`FiniteExtensiveFormGame`, such as
+    :attr:`successors` and :attr:`information_partition`, are views over
+    the arrays, so the algorithms accept either representation.
+
+    :param node_labels: The optional labels of the nodes.
+    :param information_sets: A finite set of information sets.
+    :param actions: A finite set of actions.
+    :param players: A finite set of players.
+    :param nature: The optional nature player.
+    :param parents: The index of the parent of each node, or ``-1`` at
+                    the initial node.
+    :param action_ids: The index of the action leading to each node, or
+                       ``-1`` at the initial node.
+    :param information_set_ids: The index of the information set of
+                                each node, or ``-1`` at the terminal
+                                nodes.
+    :param player_ids: The index of the player of each information set.
+    :param chance_probabilities: The probability of the chance action
+                                 leading to each node, or ``0`` if the
+                                 action is not a chance action.
+    :param payoff_matrix: The payoff of each player at each node, or
+                          ``0`` at the non-terminal nodes and for the
+                          nature.
+    :param trusted: ``True`` to skip the validation of a game that is
+                    valid by construction, defaults to ``False``.
+    :raises ValueError: If the shapes of the arrays are inconsistent,
+                        or the game is not trusted and invalid.
+    """
+
+    node_labels: Sequence[_V] | None
+    """The optional labels of the nodes."""
+    information_sets: FrozenOrderedSet[_H]
+    """A finite set of information sets."""
+    actions: FrozenOrderedSet[_A]
+    """A finite set of actions."""
+    players: FrozenOrderedSet[_I]
+    """A finite set of players."""
+    nature: _I | None
+    """The optional nature player."""
+    parents: Any
+    """The parent indices of the nodes."""
+    action_ids: Any
+    """The indices of the actions leading to the nodes."""
+    information_set_ids: Any
+    """The information set indices of the nodes."""
+    player_ids: Any
+    """The player indices of the information sets."""
+    chance_probabilities: Any
+    """The probabilities of the chance actions leading to the nodes."""
+    payoff_matrix: Any
+    """The payoffs of the players at the nodes."""
+    trusted: bool = field(default=False, kw_only=True)
+    """Whether the game is valid by construction."""
+
+    def __post_init__(self) -> None:
+        node_count = len(self.parents)
+
+        if (
+                self.node_labels is not None
+                and len(self.node_labels) != node_count
+        ):
+            raise ValueError('node labels not aligned with nodes')
+        elif (
+                len(self.action_ids) != node_count
+                or len(self.information_set_ids) != node_count
+                or len(self.chance_probabilities) != node_count
+        ):
+            raise ValueError('node arrays not aligned')
+        elif len(self.player_ids) != len(self.information_sets):
+            raise ValueError('player ids not aligned with information sets')
+        elif self.payoff_matrix.shape != (node_count, len(self.players)):
+            raise ValueError('payoff matrix shape mismatch')
+
+        if not self.trusted:
+            self.validate()
+
+    def validate(self) -> None:
+        """Validate the game.
+
+        The checks are those of :meth:`FiniteTree.validate` and
+        :meth:`FiniteExtensiveFormGame.validate`, but are carried out
+        with a constant number of array operations per check, except
+        for the connectivity to the initial node, which takes a
+        logarithmic number of pointer-jumping steps in the number of
+        nodes.
+
+        :return: ``None``.
+        :raises ValueError: If the game is invalid.
+        """
+        node_count = len(self.parents)
+        initial_nodes = np.flatnonzero(self.parents < 0)
+
+        if len(initial_nodes) != 1:
+            raise ValueError('not a single initial node')
+        elif (
+                (self.parents < -1).any()
+                or (self.parents >= node_count).any()
+        ):
+            raise ValueError('undefined parent')
+        elif (
+                self.node_labels is not None
+                and len(self._node_indices) != node_count
+        ):
+            raise ValueError('duplicate node labels')
+
+        ancestors = self.parents.copy()
+        ancestors[initial_nodes] = initial_nodes
+
+        for _ in range(node_count.bit_length()):
+            ancestors = ancestors[ancestors]
+
+        non_initial_mask = self.parents >= 0
+        parents = self.parents[non_initial_mask]
+        action_ids = self.action_ids[non_initial_mask]
+        decision_node_mask = np.zeros(node_count, dtype=np.bool_)
+        decision_node_mask[parents] = True
+
+        if (ancestors != initial_nodes[0]).any():
+            raise ValueError('node not descendant of initial node')
+        elif (self.action_ids[initial_nodes] != -1).any():
+            raise ValueError('action defined for initial node')
+        elif (
+                (action_ids < 0).any()
+                or (action_ids >= len(self.actions)).any()
+        ):
+            raise ValueError('undefined action in action partition')
+        elif (
+                (self.information_set_ids >= 0)
+                != decision_node_mask
+        ).any():
+            raise ValueError('information partition not on decision nodes')
+        elif (
+                self.information_set_ids >= len(self.information_sets)
+        ).any():
+            raise ValueError('undefined infoset in information partition')
+        elif self.nature is not None and self.nature not in self.players:
+            raise ValueError('nature not member of players')
+        elif (
+                (self.player_ids < 0).any()
+                or (self.player_ids >= len(self.players)).any()
+        ):
+            raise ValueError('undefined player in player partition')
+
+        children = self.children[
+            np.lexsort(
+                (self.action_ids[self.children], self.parents[self.children]),
+            )
+        ]
+        parents = self.parents[children]
+        action_ids = self.action_ids[children]
+        child_counts = np.diff(self.child_offsets)
+        first_nodes = self._first_nodes[self.information_set_ids[parents]]
+
+        if ((np.diff(parents) == 0) & (np.diff(action_ids) == 0)).any():
+            raise ValueError('actions not bijection with successors')
+        elif (child_counts[parents] != child_counts[first_nodes]).any():
+            raise ValueError('actions not bijection with successors')
+
+        first_children = children[
+            self.child_offsets[first_nodes]
+            + np.arange(len(children))
+            - self.child_offsets[parents]
+        ]
+
+        if (self.action_ids[first_children] != action_ids).any():
+            raise ValueError('actions not bijection with successors')
+
+        if self.nature is None:
+            nature_id = -1
+        else:
+            nature_id = self._player_labels.index(self.nature)
+
+        nature_child_mask = (
+            self.player_ids[self.information_set_ids[parents]] == nature_id
+        )
+        chance_probabilities = self.chance_probabilities[children]
+
+        if chance_probabilities[~nature_child_mask].any():
+            raise ValueError('probabilities defined for non-chance actions')
+        elif (
+                self.chance_probabilities[first_children]
+                != chance_probabilities
+        ).any():
+            raise ValueError('probabilities inconsistent in infoset')
+        elif self.payoff_matrix[decision_node_mask].any():
+            raise ValueError('payoffs defined for non-terminal nodes')
+        elif nature_id >= 0 and self.payoff_matrix[:, nature_id].any():
+            raise ValueError('payoffs defined for nature')
+
+    @classmethod
+    def from_finite_extensive_form_game(
+            cls,
+            game: FiniteExtensiveFormGame[_V, _H, _A, _I],
+            node_labels: bool = False,
+    ) -> CompactGame[_V, _H, _A, _I]:
+        """Convert a finite extensive-form game.
+
+        The indices are stored as 32-bit integers when every index fits,
+        otherwise as pointer-sized integers. The node labels, which
+        usually dominate the memory footprint of a large game, are
+        dropped by default, so the conversion is lossless only with
+        ``node_labels=True``.
+
+        :param game: The finite extensive-form game.
+        :param node_labels: ``True`` to keep the node labels, ``False``
+                            to label the nodes by their indices, defaults
+                            to ``False``.
+        :return: The compact game.
+        """
+        node_indices = dict(zip(game.nodes, count()))
+        information_set_indices = dict(zip(game.information_sets, count()))
+        action_indices = dict(zip(game.actions, count()))
+        player_indices = dict(zip(game.players, count()))
+        dtype = _get_index_dtype(
+            max(
+                len(node_indices),
+                len(information_set_indices),
+                len(action_indices),
+                len(player_indices),
+            ),
+        )
+        parents = np.full(len(node_indices), -1, dtype=dtype)
+        action_ids = np.full(len(node_indices), -1, dtype=dtype)
+        information_set_ids = np.full(len(node_indices), -1, dtype=dtype)
+        chance_probabilities = np.zeros(len(node_indices))
+        payoff_matrix = np.zeros((len(node_indices), len(player_indices)))
+
+        for node, v in node_indices.items():
+            if node in game.decision_nodes:
+                information_set_ids[v] = information_set_indices[
+                    game.information_partition[node]
+                ]
+
+            if node not in game.non_initial_nodes:
+                continue
+
+            predecessor = game.predecessors[node]
+            information_set = game.information_partition[predecessor]
+            action = game.action_partition[node]
+            parents[v] = node_indices[predecessor]
+            action_ids[v] = action_indices[action]
+
+            if information_set in game.nature_probabilities:
+                chance_probabilities[v] = (
+                    game.nature_probabilities[information_set][action]
+                )
+
+        for node, payoffs in game.payoffs.items():
+            for player, payoff in payoffs.items():
+                payoff_matrix[node_indices[node], player_indices[player]] = (
+                    payoff
+                )
+
+        return cls(
+            tuple(node_indices) if node_labels else None,
+            game.information_sets,
+            game.actions,
+            game.players,
+            game.nature,
+            parents,
+            action_ids,
+            information_set_ids,
+            np.fromiter(
+                (
+                    player_indices[game.player_partition[information_set]]
+                    for information_set in game.information_sets
+                ),
+                dtype=dtype,
+                count=len(information_set_indices),
+            ),
+            chance_probabilities,
+            payoff_matrix,
+            trusted=True,
+        )
+
+    def to_finite_extensive_form_game(
+            self,
+    ) -> FiniteExtensiveFormGame[_V, _H, _A, _I]:
+        """Convert to a finite extensive-form game.
+
+        :return: The finite extensive-form game.
+        """
+        return FiniteExtensiveFormGame(
+            FiniteTree(
+                FrozenOrderedSet(self.nodes),
+                self.initial_node,
+                FrozenOrderedSet(self.terminal_nodes),
+                FrozenOrderedMapping(self.predecessors),
+                trusted=True,
+            ),
+            self.information_sets,
+            FrozenOrderedMapping(self.information_partition),
+            self.actions,
+            FrozenOrderedMapping(self.action_partition),
+            self.players,
+            self.nature,
+            self.player_partition,
+            self.nature_probabilities,
+            FrozenOrderedMapping(self.payoffs),
+            trusted=True,
+        )
+
+    def _get_pickled_labels(self) -> bytes:
+        return pickle.dumps(
+            (
+                None if self.node_labels is None else tuple(self.node_labels),
+                tuple(self.information_sets),
+                tuple(self.actions),
+                tuple(self.players),
+                self.nature,
+            ),
+        )
+
+    @cached_property
+    def digest(self) -> str:
+        """Return the digest of the content of the game.
+
+        The digest is a SHA-256 hash of the arrays and the pickled
+        labels, and keys the compiled tensors of the game in
+        :class:`gpugt.caches.DiskCache`.
+
+        :return: The hexadecimal digest.
+        """
+        hash_ = sha256(self._get_pickled_labels())
+
+        for name in _ARRAY_NAMES:
+            array = np.ascontiguousarray(getattr(self, name))
+
+            hash_.update(array.dtype.str.encode())
+            hash_.update(repr(array.shape).encode())
+            hash_.update(array.data)
+
+        return hash_.hexdigest()
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Save the game in a binary format.
+
+        The arrays are written raw at aligned offsets after a header
+        describing them, followed by the pickled labels. The file is
+        written to a unique temporary file in the same directory, which
+        replaces the one at the path only once it is completely
+        written. A finite extensive-form game is saved by converting it
+        with :meth:`from_finite_extensive_form_game` first.
+
+        :param path: The path of the file.
+        :return: ``None``.
+        """
+        arrays = [
+            np.ascontiguousarray(getattr(self, name)) for name in _ARRAY_NAMES
+        ]
+        labels = self._get_pickled_labels()
+        array_headers = list[dict[str, Any]]()
+        offset = 0
+
+        for name, array in zip(_ARRAY_NAMES, arrays):
+            offset += _get_padding(offset)
+
+            array_headers.append(
+                {
+                    'name': name,
+                    'dtype': array.dtype.str,
+                    'shape': array.shape,
+                    'offset': offset,
+                },
+            )
+
+            offset += array.nbytes
+
+        offset += _get_padding(offset)
+        header: dict[str, Any] = {
+            'arrays': array_headers,
+            'labels': {'offset': offset, 'length': len(labels)},
+        }
+        raw_header = json.dumps(header).encode()
+        data_offset = len(_MAGIC) + 8 + len(raw_header)
+        data_offset += _get_padding(data_offset)
+        descriptor, temporary_path = mkstemp(
+            suffix='.tmp',
+            dir=Path(path).parent,
+        )
+
+        try:
+            with open(descriptor, 'wb') as file:
+                file.write(_MAGIC)
+                file.write(len(raw_header).to_bytes(8, 'little'))
+                file.write(raw_header)
+
+                for array_header, array in zip(array_headers, arrays):
+                    file.seek(data_offset + array_header['offset'])
+                    file.write(array.tobytes())
+
+                file.seek(data_offset + header['labels']['offset'])
+                file.write(labels)
+
+            replace(temporary_path, path)
+        except BaseException:
+            remove(temporary_path)
+
+            raise
+
+    @classmethod
+    def load(
+            cls,
+            path: str | PathLike[str],
+            mmap: bool = False,
+    ) -> CompactGame[Any, Any, Any, Any]:
+        """Load a game saved by :meth:`save`.
+
+        With memory mapping, the arrays are read-only views of the file,
+        so the processes loading the same file share a single
+        page-cached copy. The loaded game is trusted, but can be
+        validated with :meth:`validate`.
+
+        As the labels are pickled, only load trusted files.
+
+        :param path: The path of the file.
+        :param mmap: ``True`` to memory-map the arrays, ``False`` to
+                     read them into memory, defaults to ``False``.
+        :return: The game.
+        :raises ValueError: If the file is not a saved game.
+        """
+        with open(path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError('not a saved game')
+
+            header_length = int.from_bytes(file.read(8), 'little')
+            header = json.loads(file.read(header_length))
+            data_offset = len(_MAGIC) + 8 + header_length
+            data_offset += _get_padding(data_offset)
+
+            file.seek(data_offset + header['labels']['offset'])
+
+            labels = pickle.loads(file.read(header['labels']['length']))
+
+        arrays = dict[str, Any]()
+
+        for array_header in header['arrays']:
+            dtype = np.dtype(array_header['dtype'])
+            shape = tuple(array_header['shape'])
+            offset = data_offset + array_header['offset']
+
+            array: Any
+
+            if mmap and prod(shape):
+                array = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode='r',
+                    offset=offset,
+                    shape=shape,
+                )
+            else:
+                array = np.fromfile(
+                    path,
+                    dtype=dtype,
+                    count=prod(shape),
+                    offset=offset,
+                ).reshape(shape)
+
+            arrays[array_header['name']] = array
+
+        node_labels, information_sets, actions, players, nature = labels
+
+        return cls(
+            node_labels,
+            FrozenOrderedSet(information_sets),
+            FrozenOrderedSet(actions),
+            FrozenOrderedSet(players),
+            nature,
+            **arrays,
+            trusted=True,
+        )
+
+    @cached_property
+    def _node_indices(self) -> dict[_V, int]:
+        assert self.node_labels is not None
+
+        return dict(zip(self.node_labels, count()))
+
+    def get_node(self, index: int) -> _V:
+        """Return the node at an index.
+
+        :param index: The index of the node.
+        :return: The node.
+        """
+        if self.node_labels is None:
+            return index  # type: ignore[return-value]
+
+        return self.node_labels[index]
+
+    def get_node_index(self, node: _V) -> int:
+        """Return the index of a node.
+
+        :param node: The node.
+        :return: The index of the node.
+        :raises KeyError: If the node is not a member of the nodes.
+        """
+        if self.node_labels is not None:
+            return self._node_indices[node]
+        elif (
+                not isinstance(node, int)
+                or not 0 <= node < len(self.parents)
+        ):
+            raise KeyError(node)
+
+        return node
+
+    @cached_property
+    def _information_set_labels(self) -> tuple[_H, ...]:
+        return tuple(self.information_sets)
+
+    @cached_property
+    def _action_labels(self) -> tuple[_A, ...]:
+        return tuple(self.actions)
+
+    @cached_property
+    def _player_labels(self) -> tuple[_I, ...]:
+        return tuple(self.players)
+
+    @cached_property
+    def child_offsets(self) -> Any:
+        """Return the offsets of the children of each node in
+        :attr:`children`.
+
+        The children of the ``v``-th node are
+        ``children[child_offsets[v]:child_offsets[v + 1]]``.
+
+        :return: The child offsets.
+        """
+        return np.searchsorted(
+            self.parents[self.children],
+            np.arange(len(self.parents) + 1),
+        )
+
+    @cached_property
+    def children(self) -> Any:
+        """Return the indices of the non-initial nodes grouped by their
+        parents.
+
+        :return: The children.
+        """
+        children = np.argsort(self.parents, kind='stable')
+
+        return children[self.parents[children] >= 0]
+
+    @cached_property
+    def _first_nodes(self) -> Any:
+        first_nodes = np.full(len(self.information_sets), -1, dtype=np.intp)
+        decision_nodes = np.flatnonzero(self.information_set_ids >= 0)
+        information_sets, indices = np.unique(
+            self.information_set_ids[decision_nodes],
+            return_index=True,
+        )
+        first_nodes[information_sets] = decision_nodes[indices]
+
+        return first_nodes
+
+    def _get_children(self, v: int) -> Any:
+        return self.children[self.child_offsets[v]:self.child_offsets[v + 1]]
+
+    @cached_property
+    def nodes(self) -> Set[_V]:
+        """Return a finite set of nodes.
+
+        :return: A finite set of nodes.
+        """
+        return _NodeSet(self, np.ones(len(self.parents), dtype=np.bool_))
+
+    @cached_property
+    def initial_node(self) -> _V:
+        """Return the unique initial node.
+
+        :return: The unique initial node.
+        """
+        return self.get_node(int(np.flatnonzero(self.parents < 0)[0]))
+
+    @cached_property
+    def terminal_nodes(self) -> Set[_V]:
+        """Return a finite set of terminal nodes.
+
+        :return: A finite set of terminal nodes.
+        """
+        return _NodeSet(self, self.information_set_ids < 0)
+
+    @cached_property
+    def non_initial_nodes(self) -> Set[_V]:
+        """Return a finite set of non-initial nodes.
+
+        :return: A finite set of non-initial nodes.
+        """
+        return _NodeSet(self, self.parents >= 0)
+
+    @cached_property
+    def decision_nodes(self) -> Set[_V]:
+        """Return a finite set of decision nodes.
+
+        :return: A finite set of decision nodes.
+        """
+        return _NodeSet(self, self.information_set_ids >= 0)
+
+    @cached_property
+    def predecessors(self) -> Mapping[_V, _V]:
+        """Return the immediate predecessors (value) of each non-initial
+        node (key).
+
+        :return: An immediate predecessor function.
+        """
+        return _NodeMapping(
+            _NodeSet(self, self.parents >= 0),
+            lambda v: self.get_node(int(self.parents[v])),
+        )
+
+    @cached_property
+    def successors(self) -> Mapping[_V, FrozenOrderedSet[_V]]:
+        """Return the immediate successors (value) of each decision node
+        (key).
+
+        :return: An immediate successor function.
+        """
+        return _NodeMapping(
+            _NodeSet(self, self.information_set_ids >= 0),
+            lambda v: FrozenOrderedSet(
+                map(self.get_node, self._get_children(v).tolist()),
+            ),
+        )
+
+    @cached_property
+    def information_partition(self) -> Mapping[_V, _H]:
+        """Return the information sets (value) of the decision nodes
+        (key).
+
+        :return: The information partition.
+        """
+        return _NodeMapping(
+            _NodeSet(self, self.information_set_ids >= 0),
+            lambda v: self._information_set_labels[
+                self.information_set_ids[v]
+            ],
+        )
+
+    @cached_property
+    def action_partition(self) -> Mapping[_V, _A]:
+        """Return the actions (value) leading to the non-initial nodes
+        (key).
+
+        :return: The action partition.
+        """
+        return _NodeMapping(
+            _NodeSet(self, self.parents >= 0),
+            lambda v: self._action_labels[self.action_ids[v]],
+        )
+
+    @cached_property
+    def player_partition(self) -> FrozenOrderedMapping[_H, _I]:
+        """Return the players (value) of the information sets (key).
+
+        :return: The player partition.
+        """
+        return FrozenOrderedMapping(
+            zip(
+                self.information_sets,
+                map(self._player_labels.__getitem__, self.player_ids.tolist()),
+            ),
+        )
+
+    @cached_property
+    def available_actions(
+            self,
+    ) -> FrozenOrderedMapping[_H, FrozenOrderedSet[_A]]:
+        """Return finite sets of available actions (value) at each
+        information set (key).
+
+        :return: The available actions.
+        """
+        available_actions = dict[_H, FrozenOrderedSet[_A]]()
+
+        for information_set, v in zip(
+                self.information_sets,
+                self._first_nodes.tolist(),
+        ):
+            if v < 0:
+                continue
+
+            available_actions[information_set] = FrozenOrderedSet(
+                map(
+                    self._action_labels.__getitem__,
+                    self.action_ids[self._get_children(v)].tolist(),
+                ),
+            )
+
+        return FrozenOrderedMapping(available_actions)
+
+    @cached_property
+    def nature_information_sets(self) -> FrozenOrderedSet[_H]:
+        """Return a finite set of information sets associated with the
+        nature.
+
+        :return: The nature information sets.
+        """
+        return FrozenOrderedSet(
+            information_set
+            for information_set, player in self.player_partition.items()
+            if player == self.nature
+        )
+
+    @cached_property
+    def nature_probabilities(
+            self,
+    ) -> FrozenOrderedMapping[_H, FrozenOrderedMapping[_A, float]]:
+        """Return the probabilities (value) of the chance actions (key)
+        at each nature information set.
+
+        :return: The nature probabilities.
+        """
+        nature_probabilities = dict[_H, FrozenOrderedMapping[_A, float]]()
+        information_set_indices = dict(zip(self.information_sets, count()))
+
+        for information_set in self.nature_information_sets:
+            v = self._first_nodes[information_set_indices[information_set]]
+
+            if v < 0:
+                continue
+
+            children = self._get_children(v)
+            nature_probabilities[information_set] = FrozenOrderedMapping(
+                zip(
+                    map(
+                        self._action_labels.__getitem__,
+                        self.action_ids[children].tolist(),
+                    ),
+                    self.chance_probabilities[children].tolist(),
+                ),
+            )
+
+        return FrozenOrderedMapping(nature_probabilities)
+
+    @cached_property
+    def _rational_player_ids(self) -> list[int]:
+        return [
+            i
+            for i, player in enumerate(self.players)
+            if player != self.nature
+        ]
+
+    @cached_property
+    def payoffs(self) -> Mapping[_V, FrozenOrderedMapping[_I, float]]:
+        """Return the payoff profiles (value) at each terminal node
+        (key).
+
+        :return: The payoffs.
+        """
+        return _NodeMapping(
+            _NodeSet(self, self.information_set_ids < 0),
+            lambda v: FrozenOrderedMapping(
+                zip(
+                    map(
+                        self._player_labels.__getitem__,
+                        self._rational_player_ids,
+                    ),
+                    self.payoff_matrix[v, self._rational_player_ids].tolist(),
+                ),
+            ),
+        )
@@ -4,7 +4,7 @@ extensive-form game.
 
 from collections.abc import Hashable
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Generic, TypeVar
 
@@ -35,6 +35,9 @@ class FiniteExtensiveFormGame(Generic[_V, _H, _A, _I]):
     :param chance_probabilities: A family of probabilities of chance
                                  actions.
     :param payoffs: Payoff profiles.
+    :param trusted: ``True`` to skip the validation of a game that is
+                    valid by construction, defaults to ``False``.
+    :raises ValueError: If the game is not trusted and invalid.
     """
 
     game_tree: FiniteTree[_V]
@@ -70,8 +73,25 @@ class FiniteExtensiveFormGame(Generic[_V, _H, _A, _I]):
     """The payoff profiles of each player (value) at each terminal node
     (key).
     """
+    trusted: bool = field(default=False, kw_only=True, compare=False)
+    """Whether the game is valid by construction.
+
+    The builders of this library construct trusted games, as the
+    validation dominates the construction time of large games.
+    """
 
     def __post_init__(self) -> None:
+        if not self.trusted:
+            self.validate()
+
+    def validate(self) -> None:
+        """Validate the game.
+
+        The game tree is validated on its own construction.
+
+        :return: ``None``.
+        :raises ValueError: If the game is invalid.
+        """
         if self.information_partition.keys() != self.decision_nodes:
             raise ValueError('information partition not on decision nodes')
         elif (
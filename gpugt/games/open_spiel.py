@@ -14,6 +14,7 @@ except ImportError:
 from gpugt.collections2 import FrozenOrderedMapping, FrozenOrderedSet
 from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
 from gpugt.graphs.finite_tree import FiniteTree
+from gpugt.graphs.traversals import pre_order
 
 _V = Any
 _H = Any
@@ -30,20 +31,33 @@ def create_open_spiel(game: Game) -> FiniteExtensiveFormGame[_V, _H, _A, _I]:
     vertices = []
     root = game.new_initial_state()
     leaves = []
-    parents = {}
+    parents = dict[_V, _V]()
     information_sets = []
     information_partition = {}
     actions = []
-    action_partition = {}
+    action_partition = dict[_V, _A]()
     players = []
     nature = None
     player_partition = {}
     nature_probabilities = dict[_H, FrozenOrderedMapping[_A, float]]()
     payoffs = dict[_V, FrozenOrderedMapping[_I, float]]()
 
-    def update(vertex: _V, parent: _V | None, action: _A | None) -> None:
-        nonlocal nature
+    def get_children(
+            item: tuple[_V, _V | None, _A | None],
+    ) -> list[tuple[_V, _V | None, _A | None]]:
+        vertex, _, _ = item
 
+        if vertex.is_terminal():
+            return []
+
+        return [
+            (vertex.child(action), vertex, action)
+            for action in vertex.legal_actions()
+        ]
+
+    item: tuple[_V, _V | None, _A | None] = root, None, None
+
+    for vertex, parent, action in pre_order(item, get_children):
         vertices.append(vertex)
 
         if parent is not None:
@@ -71,9 +85,8 @@ def create_open_spiel(game: Game) -> FiniteExtensiveFormGame[_V, _H, _A, _I]:
             information_sets.append(information_set)
 
             information_partition[vertex] = information_set
-            sub_actions = vertex.legal_actions()
 
-            actions.extend(sub_actions)
+            actions.extend(vertex.legal_actions())
 
             player = vertex.current_player()
 
@@ -87,19 +100,13 @@ def create_open_spiel(game: Game) -> FiniteExtensiveFormGame[_V, _H, _A, _I]:
                     vertex.chance_outcomes(),
                 )
 
-            for action in sub_actions:
-                child = vertex.child(action)
-
-                update(child, vertex, action)
-
-    update(root, None, None)
-
     return FiniteExtensiveFormGame(
         FiniteTree(
             FrozenOrderedSet(vertices),
             root,
             FrozenOrderedSet(leaves),
             FrozenOrderedMapping(parents),
+            trusted=True,
         ),
         FrozenOrderedSet(information_sets),
         FrozenOrderedMapping(information_partition),
@@ -110,6 +117,7 @@ def create_open_spiel(game: Game) -> FiniteExtensiveFormGame[_V, _H, _A, _I]:
         FrozenOrderedMapping(player_partition),
         FrozenOrderedMapping(nature_probabilities),
         FrozenOrderedMapping(payoffs),
+        trusted=True,
     )
 
 
@@ -121,14 +129,14 @@ def create_open_spiel_int(
     :param game: The OpenSpiel game.
     :return: A game created from OpenSpiel.
     """
-    vertices = []
+    vertices = list[_V]()
     root = game.new_initial_state()
     leaves = []
-    parents = {}
+    parents = dict[_V, _V]()
     information_sets = []
     information_partition = {}
     actions = []
-    action_partition = {}
+    action_partition = dict[_V, _A]()
     players = []
     nature = None
     player_partition = {}
@@ -136,8 +144,26 @@ def create_open_spiel_int(
     payoffs = dict[_V, FrozenOrderedMapping[_I, float]]()
     ids = count()
 
-    def update(state, vertex: _V, parent: _V | None, action: _A | None) -> None:
-        nonlocal nature
+    def get_children(
+            item: tuple[Any, _V | None, _A | None],
+    ) -> list[tuple[Any, _V | None, _A | None]]:
+        state, _, _ = item
+
+        if state.is_terminal():
+            return []
+
+        # The children are gotten right after their parent is visited.
+        vertex = vertices[-1]
+
+        return [
+            (state.child(action), vertex, action)
+            for action in state.legal_actions()
+        ]
+
+    item: tuple[Any, _V | None, _A | None] = root, None, None
+
+    for state, parent, action in pre_order(item, get_children):
+        vertex = next(ids)
 
         vertices.append(vertex)
 
@@ -166,9 +192,8 @@ def create_open_spiel_int(
             information_sets.append(information_set)
 
             information_partition[vertex] = information_set
-            sub_actions = state.legal_actions()
 
-            actions.extend(sub_actions)
+            actions.extend(state.legal_actions())
 
             player = state.current_player()
 
@@ -182,19 +207,13 @@ def create_open_spiel_int(
                     state.chance_outcomes(),
                 )
 
-            for action in sub_actions:
-                child = state.child(action)
-
-                update(child, next(ids), vertex, action)
-
-    update(root, next(ids), None, None)
-
     return FiniteExtensiveFormGame(
         FiniteTree(
             FrozenOrderedSet(vertices),
             0,
             FrozenOrderedSet(leaves),
             FrozenOrderedMapping(parents),
+            trusted=True,
         ),
         FrozenOrderedSet(information_sets),
         FrozenOrderedMapping(information_partition),
@@ -205,4 +224,5 @@ def create_open_spiel_int(
         FrozenOrderedMapping(player_partition),
         FrozenOrderedMapping(nature_probabilities),
         FrozenOrderedMapping(payoffs),
+        trusted=True,
     )
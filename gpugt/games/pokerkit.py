@@ -25,6 +25,7 @@ except ImportError:
 from gpugt.collections2 import FrozenOrderedMapping, FrozenOrderedSet
 from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
 from gpugt.graphs.finite_tree import FiniteTree
+from gpugt.graphs.traversals import pre_order
 
 
 _V = tuple[Operation, ...]
@@ -49,19 +50,67 @@ def create_pokerkit(
     :return: a poker game.
     """
     vertices = []
-    root = ()
+    root: _V = ()
     leaves = []
     parents = {}
     information_sets = []
-    information_partition = {}
+    information_partition = dict[_V, _H]()
     actions = list[_A]()
     action_partition = {}
     nature = 'Dealer'
-    player_partition = {}
+    player_partition = dict[_H, _I]()
     nature_probabilities = dict[_H, FrozenOrderedMapping[_A, float]]()
     payoffs = dict[_V, FrozenOrderedMapping[_I, float]]()
 
-    def update(state: State, vertex: _V) -> None:
+    def get_children(item: tuple[State, _V]) -> list[tuple[State, _V]]:
+        state, vertex = item
+
+        if state.can_burn_card():
+            state.burn_card('??')
+
+        children = []
+
+        def act(method: Any, *args: Any, **kwargs: Any) -> None:
+            next_state = deepcopy(state)
+            sub_action = method(next_state, *args, **kwargs)
+
+            children.append((next_state, vertex + (sub_action,)))
+
+        if state.actor_index is not None:
+            if state.can_fold():
+                act(State.fold)
+
+            if state.can_check_or_call():
+                act(State.check_or_call)
+
+            if state.can_complete_bet_or_raise_to():
+                for amount in amount_factory(state):
+                    act(State.complete_bet_or_raise_to, amount)
+        elif state.can_deal_hole():
+            assert state.hole_dealee_index is not None
+
+            for cards in combinations(
+                    state.deck_cards,
+                    len(state.hole_dealing_statuses[state.hole_dealee_index]),
+            ):
+                act(State.deal_hole, cards)
+        elif state.status:
+            raise NotImplementedError
+
+        if vertex in information_partition:
+            information_set = information_partition[vertex]
+
+            if player_partition[information_set] == nature:
+                nature_probabilities[information_set] = FrozenOrderedMapping(
+                    zip(
+                        (next_vertex[-1] for _, next_vertex in children),
+                        repeat(1 / len(children)),
+                    ),
+                )
+
+        return children
+
+    for state, vertex in pre_order((initial_state, root), get_children):
         vertices.append(vertex)
 
         if vertex:
@@ -105,54 +154,13 @@ def create_pokerkit(
 
             information_partition[vertex] = information_set
 
-        if state.can_burn_card():
-            state.burn_card('??')
-
-        sub_actions = []
-
-        def act(method: Any, *args: Any, **kwargs: Any) -> None:
-            next_state = deepcopy(state)
-            sub_action = method(next_state, *args, **kwargs)
-            next_vertex = vertex + (sub_action,)
-
-            sub_actions.append(sub_action)
-            update(next_state, next_vertex)
-
-        if state.actor_index is not None:
-            if state.can_fold():
-                act(State.fold)
-
-            if state.can_check_or_call():
-                act(State.check_or_call)
-
-            if state.can_complete_bet_or_raise_to():
-                for amount in amount_factory(state):
-                    act(State.complete_bet_or_raise_to, amount)
-        elif state.can_deal_hole():
-            assert state.hole_dealee_index is not None
-
-            for cards in combinations(
-                    state.deck_cards,
-                    len(state.hole_dealing_statuses[state.hole_dealee_index]),
-            ):
-                act(State.deal_hole, cards)
-        elif state.status:
-            raise NotImplementedError
-
-        if information_set is not None:
-            if player == nature:
-                nature_probabilities[information_set] = FrozenOrderedMapping(
-                    zip(sub_actions, repeat(1 / len(sub_actions))),
-                )
-
-    update(initial_state, root)
-
     return FiniteExtensiveFormGame(
         FiniteTree(
             FrozenOrderedSet(vertices),
             root,
             FrozenOrderedSet(leaves),
             FrozenOrderedMapping(parents),
+            trusted=True,
         ),
         FrozenOrderedSet(information_sets),
         FrozenOrderedMapping(information_partition),
@@ -163,6 +171,7 @@ def create_pokerkit(
         FrozenOrderedMapping(player_partition),
         FrozenOrderedMapping(nature_probabilities),
         FrozenOrderedMapping(payoffs),
+        trusted=True,
     )
 
 
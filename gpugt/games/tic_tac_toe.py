@@ -7,6 +7,7 @@ from typing import TypeAlias
 from gpugt.collections2 import FrozenOrderedMapping, FrozenOrderedSet
 from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
 from gpugt.graphs.finite_tree import FiniteTree
+from gpugt.graphs.traversals import pre_order
 
 _A = int
 _V = tuple[_A, ...]
@@ -32,18 +33,24 @@ def create_tic_tac_toe() -> TicTacToe:
     :return: A tic-tac-toe game.
     """
     vertices = []
-    root = ()
+    root: _V = ()
     leaves = []
     parents = {}
     information_sets = []
-    information_partition = {}
+    information_partition = dict[_V, _H]()
     actions = range(9)
     action_partition = {}
     players = 'XO'
     player_partition = {}
     payoffs = dict[_V, FrozenOrderedMapping[_I, float]]()
 
-    def update(vertex: _V) -> None:
+    def get_children(vertex: _V) -> list[_V]:
+        if vertex not in information_partition:
+            return []
+
+        return [vertex + (action,) for action in set(actions) - set(vertex)]
+
+    for vertex in pre_order(root, get_children):
         vertices.append(vertex)
 
         if vertex:
@@ -73,17 +80,13 @@ def create_tic_tac_toe() -> TicTacToe:
             information_partition[vertex] = information_set
             player_partition[information_set] = players[len(vertex) % 2]
 
-            for action in set(actions) - set(vertex):
-                update(vertex + (action,))
-
-    update(root)
-
     return FiniteExtensiveFormGame(
         FiniteTree(
             FrozenOrderedSet(vertices),
             root,
             FrozenOrderedSet(leaves),
             FrozenOrderedMapping(parents),
+            trusted=True,
         ),
         FrozenOrderedSet(information_sets),
         FrozenOrderedMapping(information_partition),
@@ -94,4 +97,5 @@ def create_tic_tac_toe() -> TicTacToe:
         FrozenOrderedMapping(player_partition),
         FrozenOrderedMapping(),
         FrozenOrderedMapping(payoffs),
+        trusted=True,
     )
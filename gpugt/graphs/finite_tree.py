@@ -2,7 +2,7 @@
 
 from collections.abc import Hashable
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Generic, TypeVar
 
@@ -19,6 +19,9 @@ class FiniteTree(Generic[_V]):
     :param root: The root.
     :param leaves: A finite set of leaves.
     :param parents: The parents.
+    :param trusted: ``True`` to skip the validation of a tree that is
+                    valid by construction, defaults to ``False``.
+    :raises ValueError: If the tree is not trusted and invalid.
     """
 
     vertices: FrozenOrderedSet[_V]
@@ -29,8 +32,19 @@ class FiniteTree(Generic[_V]):
     """A finite set of leaves (vertices without any child)."""
     parents: FrozenOrderedMapping[_V, _V]
     """The parents (value) for each child (key)."""
+    trusted: bool = field(default=False, kw_only=True, compare=False)
+    """Whether the tree is valid by construction."""
 
     def __post_init__(self) -> None:
+        if not self.trusted:
+            self.validate()
+
+    def validate(self) -> None:
+        """Validate the tree.
+
+        :return: ``None``.
+        :raises ValueError: If the tree is invalid.
+        """
         if self.root not in self.vertices:
             raise ValueError('root not a member of nodes')
         elif not self.leaves <= self.vertices:
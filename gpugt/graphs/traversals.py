@@ -0,0 +1,93 @@
+""":mod:`gpugt.graphs.traversals` defines the iterative traversals of
+trees.
+
+The traversals keep explicit stacks or queues instead of recursing, so
+the depths of the trees are unbounded. The children of each node are
+gotten lazily, only once the node is expanded, so they may depend on
+what was done with the nodes yielded before.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from collections import deque
+from typing import TypeVar
+
+_T = TypeVar('_T')
+
+
+def pre_order(
+        root: _T,
+        get_children: Callable[[_T], Iterable[_T]],
+) -> Iterator[_T]:
+    """Iterate over the nodes in pre-order.
+
+    Each node is yielded before its descendants, in the order of a
+    recursive depth-first traversal. The children of a node are gotten
+    after the node is yielded and the iteration resumes.
+
+    :param root: The root.
+    :param get_children: The function returning the children of a node.
+    :return: The nodes in pre-order.
+    """
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+
+        yield node
+
+        stack.extend(reversed(tuple(get_children(node))))
+
+
+def post_order(
+        root: _T,
+        get_children: Callable[[_T], Iterable[_T]],
+) -> Iterator[_T]:
+    """Iterate over the nodes in post-order.
+
+    Each node is yielded after its descendants, in the order of a
+    recursive depth-first traversal. The children of a node are gotten
+    when the node is reached, after its preceding siblings and their
+    descendants are yielded, so the nodes already handled can be left
+    out in directed acyclic graphs.
+
+    :param root: The root.
+    :param get_children: The function returning the children of a node.
+    :return: The nodes in post-order.
+    """
+    stack = [(root, iter(get_children(root)))]
+
+    while stack:
+        node, children = stack[-1]
+
+        for child in children:
+            stack.append((child, iter(get_children(child))))
+
+            break
+        else:
+            stack.pop()
+
+            yield node
+
+
+def level_order(
+        root: _T,
+        get_children: Callable[[_T], Iterable[_T]],
+) -> Iterator[_T]:
+    """Iterate over the nodes in level-order.
+
+    The nodes are yielded breadth-first, level by level. The children
+    of a node are gotten after the node is yielded and the iteration
+    resumes.
+
+    :param root: The root.
+    :param get_children: The function returning the children of a node.
+    :return: The nodes in level-order.
+    """
+    queue = deque([root])
+
+    while queue:
+        node = queue.popleft()
+
+        yield node
+
+        queue.extend(get_children(node))
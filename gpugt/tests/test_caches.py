@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from os import utime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import NoReturn
+from unittest import main, TestCase
+
+from gpugt.caches import DiskCache, get_key
+from gpugt.games.compact_game import CompactGame
+from gpugt.games.rock_paper_scissors import create_rock_paper_scissors_plus
+
+
+class _Color(Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _add(x: int, y: int = 1) -> int:
+    return x + y
+
+
+def _fail() -> NoReturn:
+    raise AssertionError('factory called on a hit')
+
+
+class GetKeyTestCase(TestCase):
+    def test_normalization(self) -> None:
+        values = (
+            _Color.RED,
+            _Point(1, 2),
+            {'a': [1, 2], 'b': (3,)},
+            {'x', 'y', 'z'},
+            _add,
+            'string',
+        )
+        key = get_key(*values)
+
+        self.assertEqual(len(key), 64)
+        self.assertEqual(get_key(*values), key)
+        self.assertEqual(
+            get_key(
+                _Color.RED,
+                _Point(1, 2),
+                {'a': (1, 2), 'b': [3]},
+                frozenset({'z', 'y', 'x'}),
+                _add,
+                'string',
+            ),
+            key,
+        )
+
+        for other_values in (
+                (_Color.BLUE, *values[1:]),
+                (values[0], _Point(2, 1), *values[2:]),
+                (*values[:2], {'a': [1, 2]}, *values[3:]),
+                (*values[:3], {'x', 'y'}, *values[4:]),
+                (*values[:4], _fail, values[5]),
+                (*values[:5], repr('string')),
+        ):
+            with self.subTest(other_values=other_values):
+                self.assertNotEqual(get_key(*other_values), key)
+
+        defaults = _add.__defaults__
+
+        try:
+            _add.__defaults__ = (2,)
+
+            self.assertNotEqual(get_key(*values), key)
+        finally:
+            _add.__defaults__ = defaults
+
+        self.assertEqual(get_key(*values), key)
+
+    def test_unresolvable_callables(self) -> None:
+        def add(x: int, y: int) -> int:
+            return x + y
+
+        for value in (
+                lambda x: x,
+                add,
+                partial(_add, 1),
+                _Point(1, 2).__repr__,
+        ):
+            with self.subTest(value=value):
+                self.assertRaises(TypeError, get_key, value)
+                self.assertRaises(TypeError, get_key, {'builder': value})
+
+
+class DiskCacheTestCase(TestCase):
+    def test_get_object(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = DiskCache(directory, 1 << 20)
+
+            self.assertEqual(cache.get_object('key', lambda: [1, 2]), [1, 2])
+            self.assertEqual(cache.get_object('key', _fail), [1, 2])
+            self.assertEqual(
+                [path.name for path in Path(directory).iterdir()],
+                ['key.pickle'],
+            )
+
+    def test_get_game(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = DiskCache(directory, 1 << 20)
+            game = cache.get_game(create_rock_paper_scissors_plus)
+            loaded_game = cache.get_game(create_rock_paper_scissors_plus)
+
+            self.assertIsInstance(game, CompactGame)
+            self.assertEqual(loaded_game.digest, game.digest)
+            self.assertEqual(len(list(Path(directory).iterdir())), 1)
+
+    def test_evict(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = DiskCache(directory, 1 << 20)
+            paths = {}
+
+            for i, key in enumerate('abc'):
+                cache.get_object(key, partial(bytes, 1000))
+
+                paths[key] = Path(directory, f'{key}.pickle')
+
+                utime(paths[key], (i, i))
+
+            stray_path = Path(directory, 'stray.tmp')
+
+            stray_path.write_bytes(bytes(1 << 20))
+
+            self.assertEqual(cache.get_object('a', _fail), bytes(1000))
+
+            size = paths['a'].stat().st_size
+            cache.max_size = 2 * size
+
+            cache.evict()
+
+            self.assertEqual(
+                sorted(path.name for path in Path(directory).iterdir()),
+                ['a.pickle', 'c.pickle', 'stray.tmp'],
+            )
+
+            cache.max_size = size - 1
+
+            cache.evict()
+
+            self.assertEqual(
+                sorted(path.name for path in Path(directory).iterdir()),
+                ['stray.tmp'],
+            )
+
+    def test_max_size(self) -> None:
+        with TemporaryDirectory() as directory:
+            self.assertRaises(ValueError, DiskCache, directory, 0)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
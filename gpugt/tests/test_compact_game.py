@@ -0,0 +1,222 @@
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import main, TestCase
+
+from numpy.testing import assert_array_equal
+import numpy as np
+
+from gpugt.games.compact_game import CompactGame
+from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
+from gpugt.games.pokerkit import create_kuhn_poker
+from gpugt.games.rock_paper_scissors import create_rock_paper_scissors_plus
+
+_CompactGame = CompactGame[Any, Any, Any, Any]
+
+
+class CompactGameTestCase(TestCase):
+    def test_from_finite_extensive_form_game(self) -> None:
+        games: list[FiniteExtensiveFormGame[Any, Any, Any, Any]] = [
+            create_rock_paper_scissors_plus(),
+            create_kuhn_poker(),
+        ]
+
+        for game in games:
+            with self.subTest(game=game):
+                compact_game = CompactGame.from_finite_extensive_form_game(
+                    game,
+                    node_labels=True,
+                )
+
+                self.assertEqual(
+                    compact_game.to_finite_extensive_form_game(),
+                    game,
+                )
+
+                compact_game = CompactGame.from_finite_extensive_form_game(
+                    game,
+                )
+
+                self.assertIsNone(compact_game.node_labels)
+                self.assertEqual(compact_game.initial_node, 0)
+                self.assertEqual(len(compact_game.nodes), len(game.nodes))
+
+                for name in (
+                        'parents',
+                        'action_ids',
+                        'information_set_ids',
+                        'player_ids',
+                ):
+                    self.assertEqual(
+                        getattr(compact_game, name).dtype,
+                        np.int32,
+                    )
+
+    def test_validate(self) -> None:
+        game = CompactGame.from_finite_extensive_form_game(
+            create_kuhn_poker(),
+        )
+        terminal_node = int(np.flatnonzero(game.information_set_ids < 0)[0])
+        decision_node = int(np.flatnonzero(game.information_set_ids >= 0)[1])
+        non_chance_node = int(
+            np.flatnonzero(
+                (game.parents >= 0) & (game.chance_probabilities == 0),
+            )[0],
+        )
+        siblings = game.children[game.child_offsets[0]:][:2]
+
+        def set_item(name: str, index: int, value: float) -> _CompactGame:
+            array = getattr(game, name).copy()
+            array[index] = value
+
+            return replace(game, **{name: array}, trusted=False)
+
+        def swap_parents() -> _CompactGame:
+            parents = game.parents.copy()
+            parents[terminal_node] = terminal_node
+
+            return replace(game, parents=parents, trusted=False)
+
+        def duplicate_actions() -> _CompactGame:
+            action_ids = game.action_ids.copy()
+            action_ids[siblings[1]] = action_ids[siblings[0]]
+
+            return replace(game, action_ids=action_ids, trusted=False)
+
+        def add_payoffs() -> _CompactGame:
+            payoff_matrix = game.payoff_matrix.copy()
+            payoff_matrix[decision_node] = 1
+
+            return replace(game, payoff_matrix=payoff_matrix, trusted=False)
+
+        invalid_games = {
+            'multiple initial nodes': lambda: set_item(
+                'parents',
+                terminal_node,
+                -1,
+            ),
+            'undefined parent': lambda: set_item(
+                'parents',
+                terminal_node,
+                len(game.parents),
+            ),
+            'cycle': swap_parents,
+            'initial node action': lambda: set_item('action_ids', 0, 0),
+            'undefined action': lambda: set_item(
+                'action_ids',
+                terminal_node,
+                len(game.actions),
+            ),
+            'terminal node information set': lambda: set_item(
+                'information_set_ids',
+                terminal_node,
+                0,
+            ),
+            'undefined player': lambda: set_item(
+                'player_ids',
+                0,
+                len(game.players),
+            ),
+            'duplicate actions': duplicate_actions,
+            'non-chance probability': lambda: set_item(
+                'chance_probabilities',
+                non_chance_node,
+                0.5,
+            ),
+            'non-terminal payoffs': add_payoffs,
+        }
+
+        game.validate()
+
+        for name, create_game in invalid_games.items():
+            with self.subTest(name=name):
+                self.assertRaises(ValueError, create_game)
+
+        self.assertRaises(
+            ValueError,
+            replace,
+            game,
+            parents=game.parents[1:],
+        )
+
+    def test_save_and_load(self) -> None:
+        game = create_kuhn_poker()
+
+        for node_labels in (False, True):
+            for mmap in (False, True):
+                with self.subTest(
+                        node_labels=node_labels,
+                        mmap=mmap,
+                ), TemporaryDirectory() as directory:
+                    path = Path(directory) / 'kuhn.game'
+                    compact_game = (
+                        CompactGame.from_finite_extensive_form_game(
+                            game,
+                            node_labels,
+                        )
+                    )
+
+                    compact_game.save(path)
+                    compact_game.save(path)
+
+                    loaded_game = CompactGame.load(path, mmap)
+
+                    self.assertEqual(
+                        [file.name for file in Path(directory).iterdir()],
+                        [path.name],
+                    )
+                    self.assertEqual(
+                        isinstance(loaded_game.parents, np.memmap),
+                        mmap,
+                    )
+                    self.assertEqual(loaded_game.digest, compact_game.digest)
+                    self.assertEqual(
+                        loaded_game.node_labels,
+                        compact_game.node_labels,
+                    )
+
+                    for name in (
+                            'parents',
+                            'action_ids',
+                            'information_set_ids',
+                            'player_ids',
+                            'chance_probabilities',
+                            'payoff_matrix',
+                    ):
+                        assert_array_equal(
+                            getattr(loaded_game, name),
+                            getattr(compact_game, name),
+                        )
+
+                    loaded_game.validate()
+                    self.assertEqual(
+                        loaded_game.to_finite_extensive_form_game(),
+                        compact_game.to_finite_extensive_form_game(),
+                    )
+
+    def test_digest(self) -> None:
+        game = create_rock_paper_scissors_plus()
+        compact_game = CompactGame.from_finite_extensive_form_game(game)
+        digest = compact_game.digest
+
+        self.assertEqual(
+            CompactGame.from_finite_extensive_form_game(game).digest,
+            digest,
+        )
+        self.assertEqual(len(digest), 64)
+        self.assertNotEqual(
+            CompactGame.from_finite_extensive_form_game(game, True).digest,
+            digest,
+        )
+        self.assertNotEqual(
+            replace(
+                compact_game,
+                payoff_matrix=compact_game.payoff_matrix * 2,
+            ).digest,
+            digest,
+        )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
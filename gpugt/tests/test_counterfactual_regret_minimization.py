@@ -0,0 +1,403 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import main, TestCase
+import warnings
+
+from numpy.testing import assert_allclose
+import numpy as np
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+
+    from gpugt.algorithms.counterfactual_regret_minimization import (
+        _asnumpy,
+        Backend,
+        CounterfactualRegretMinimization,
+        Variant,
+    )
+
+from gpugt.algorithms.exploitability import Exploitability
+from gpugt.collections2 import FrozenOrderedMapping, FrozenOrderedSet
+from gpugt.games.finite_extensive_form_game import FiniteExtensiveFormGame
+from gpugt.games.pokerkit import create_kuhn_poker
+from gpugt.games.rock_paper_scissors import create_rock_paper_scissors_plus
+from gpugt.graphs.finite_tree import FiniteTree
+
+
+def _create_mixed_depth_game() -> (
+        FiniteExtensiveFormGame[tuple[str, ...], str, str, str]
+):
+    vertices = [
+        (),
+        ('l',),
+        ('r',),
+        ('l', 'c'),
+        ('r', 'x'),
+        ('r', 'y'),
+        ('l', 'c', 'x'),
+        ('l', 'c', 'y'),
+    ]
+    leaves = [('r', 'x'), ('r', 'y'), ('l', 'c', 'x'), ('l', 'c', 'y')]
+    values = [1.0, -2.0, -1.0, 3.0]
+
+    return FiniteExtensiveFormGame(
+        FiniteTree(
+            FrozenOrderedSet(vertices),
+            (),
+            FrozenOrderedSet(leaves),
+            FrozenOrderedMapping(
+                {vertex: vertex[:-1] for vertex in vertices if vertex},
+            ),
+        ),
+        FrozenOrderedSet(['p', 'n', 'q']),
+        FrozenOrderedMapping(
+            {(): 'p', ('l',): 'n', ('r',): 'q', ('l', 'c'): 'q'},
+        ),
+        FrozenOrderedSet(['l', 'r', 'c', 'x', 'y']),
+        FrozenOrderedMapping({vertex: vertex[-1] for vertex in vertices[1:]}),
+        FrozenOrderedSet(['first', 'nature', 'second']),
+        'nature',
+        FrozenOrderedMapping({'p': 'first', 'n': 'nature', 'q': 'second'}),
+        FrozenOrderedMapping({'n': FrozenOrderedMapping({'c': 1.0})}),
+        FrozenOrderedMapping(
+            {
+                leaf: FrozenOrderedMapping(
+                    {'first': value, 'second': -value},
+                ) for leaf, value in zip(leaves, values)
+            },
+        ),
+    )
+
+
+class CounterfactualRegretMinimizationTestCase(TestCase):
+    def test_variants(self) -> None:
+        game = create_kuhn_poker()
+
+        for variant in Variant:
+            with self.subTest(variant=variant):
+                solver = CounterfactualRegretMinimization(
+                    game,
+                    variant=variant,
+                )
+
+                solver.solve(10)
+
+                exploitability = solver.get_exploitability()
+
+                solver.solve(290)
+
+                self.assertLess(
+                    solver.get_exploitability(),
+                    exploitability / 2,
+                )
+                self.assertLess(solver.get_exploitability(), 0.02)
+
+    def test_alternating_updates(self) -> None:
+        game = create_kuhn_poker()
+
+        for alternating_updates in (False, True):
+            with self.subTest(alternating_updates=alternating_updates):
+                solver = CounterfactualRegretMinimization(
+                    game,
+                    variant=Variant.PLUS,
+                    alternating_updates=alternating_updates,
+                )
+
+                solver.solve(10)
+
+                exploitability = solver.get_exploitability()
+
+                solver.solve(290)
+
+                self.assertEqual(solver.iteration_count, 300)
+                self.assertLess(
+                    solver.get_exploitability(),
+                    exploitability / 2,
+                )
+                self.assertLess(solver.get_exploitability(), 0.01)
+
+    def test_backends(self) -> None:
+        game = create_kuhn_poker()
+
+        for variant in Variant:
+            for alternating_updates in (False, True):
+                with self.subTest(
+                        variant=variant,
+                        alternating_updates=alternating_updates,
+                ):
+                    solvers = [
+                        CounterfactualRegretMinimization(
+                            game,
+                            variant=variant,
+                            alternating_updates=alternating_updates,
+                            backend=backend,
+                        ) for backend in Backend
+                    ]
+
+                    for solver in solvers:
+                        solver.solve(50)
+
+                    sparse_solver, segment_solver = solvers
+
+                    assert_allclose(
+                        _asnumpy(
+                            segment_solver._average_counterfactual_regrets,
+                        ),
+                        _asnumpy(
+                            sparse_solver._average_counterfactual_regrets,
+                        ),
+                        atol=1e-9,
+                    )
+                    assert_allclose(
+                        _asnumpy(segment_solver._strategy_profile),
+                        _asnumpy(sparse_solver._strategy_profile),
+                        atol=1e-9,
+                    )
+                    assert_allclose(
+                        _asnumpy(segment_solver._average_strategy_profile),
+                        _asnumpy(sparse_solver._average_strategy_profile),
+                        atol=1e-9,
+                    )
+
+    def test_pruning(self) -> None:
+        game = create_kuhn_poker()
+
+        for variant in Variant:
+            for alternating_updates in (False, True):
+                for backend in Backend:
+                    with self.subTest(
+                            variant=variant,
+                            alternating_updates=alternating_updates,
+                            backend=backend,
+                    ):
+                        solvers = [
+                            CounterfactualRegretMinimization(
+                                game,
+                                variant=variant,
+                                alternating_updates=alternating_updates,
+                                backend=backend,
+                                pruning=pruning,
+                            ) for pruning in (False, True)
+                        ]
+
+                        for solver in solvers:
+                            solver.solve(50)
+
+                        solver, pruned_solver = solvers
+
+                        assert_allclose(
+                            _asnumpy(
+                                pruned_solver._average_counterfactual_regrets,
+                            ),
+                            _asnumpy(solver._average_counterfactual_regrets),
+                        )
+                        assert_allclose(
+                            _asnumpy(pruned_solver._average_strategy_profile),
+                            _asnumpy(solver._average_strategy_profile),
+                        )
+
+    def test_get_exploitability(self) -> None:
+        games: list[FiniteExtensiveFormGame[Any, Any, Any, Any]] = [
+            create_rock_paper_scissors_plus(),
+            create_kuhn_poker(),
+            _create_mixed_depth_game(),
+        ]
+
+        for game in games:
+            solver = CounterfactualRegretMinimization(game)
+
+            self.assertEqual(
+                solver._level_best_response_tensors is None,
+                game is games[-1],
+            )
+
+            for iteration_count in (0, 1, 7, 50):
+                solver.solve(iteration_count - solver.iteration_count)
+
+                for average in (True, False):
+                    if not iteration_count and average:
+                        continue
+
+                    with self.subTest(
+                            game=game,
+                            iteration_count=iteration_count,
+                            average=average,
+                    ):
+                        self.assertAlmostEqual(
+                            solver.get_exploitability(average),
+                            Exploitability(
+                                game,
+                                solver.get_policy(average),
+                            ).exploitability,
+                        )
+
+    def test_checkpoint(self) -> None:
+        game = create_kuhn_poker()
+
+        for alternating_updates in (False, True):
+            for background in (False, True):
+                with self.subTest(
+                        alternating_updates=alternating_updates,
+                        background=background,
+                ), TemporaryDirectory() as directory:
+                    path = Path(directory) / 'checkpoint.npz'
+                    solver = CounterfactualRegretMinimization(
+                        game,
+                        variant=Variant.DISCOUNTED,
+                        alternating_updates=alternating_updates,
+                    )
+
+                    solver.solve(7)
+
+                    thread = solver.save_checkpoint(path, background)
+
+                    if thread is not None:
+                        thread.join()
+
+                    solver.solve(1)
+
+                    thread = solver.save_checkpoint(path, background)
+
+                    if thread is not None:
+                        thread.join()
+
+                    loaded_solver = CounterfactualRegretMinimization(
+                        game,
+                        variant=Variant.DISCOUNTED,
+                        alternating_updates=alternating_updates,
+                    )
+
+                    loaded_solver.load_checkpoint(path)
+                    self.assertEqual(
+                        loaded_solver.iteration_count,
+                        solver.iteration_count,
+                    )
+                    solver.solve(12)
+                    loaded_solver.solve(12)
+
+                    uninterrupted_solver = CounterfactualRegretMinimization(
+                        game,
+                        variant=Variant.DISCOUNTED,
+                        alternating_updates=alternating_updates,
+                    )
+
+                    uninterrupted_solver.solve(20)
+
+                    for other_solver in (solver, loaded_solver):
+                        assert_allclose(
+                            _asnumpy(other_solver._strategy_profile),
+                            _asnumpy(uninterrupted_solver._strategy_profile),
+                        )
+                        assert_allclose(
+                            _asnumpy(other_solver._average_strategy_profile),
+                            _asnumpy(
+                                uninterrupted_solver
+                                ._average_strategy_profile,
+                            ),
+                        )
+                        assert_allclose(
+                            _asnumpy(
+                                other_solver._average_counterfactual_regrets,
+                            ),
+                            _asnumpy(
+                                uninterrupted_solver
+                                ._average_counterfactual_regrets,
+                            ),
+                        )
+
+                    self.assertEqual(
+                        [file.name for file in Path(directory).iterdir()],
+                        [path.name],
+                    )
+
+    def test_checkpoint_mismatch(self) -> None:
+        game = create_rock_paper_scissors_plus()
+        solver = CounterfactualRegretMinimization(game)
+
+        solver.solve(3)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'checkpoint.npz'
+
+            solver.save_checkpoint(path)
+
+            for other_solver in (
+                    CounterfactualRegretMinimization(
+                        game,
+                        variant=Variant.PLUS,
+                    ),
+                    CounterfactualRegretMinimization(
+                        game,
+                        alternating_updates=True,
+                    ),
+                    CounterfactualRegretMinimization(game, dtype=np.float32),
+                    CounterfactualRegretMinimization(create_kuhn_poker()),
+            ):
+                with self.subTest(solver=other_solver):
+                    self.assertRaises(
+                        ValueError,
+                        other_solver.load_checkpoint,
+                        path,
+                    )
+
+    def test_checkpoint_error(self) -> None:
+        solver = CounterfactualRegretMinimization(
+            create_rock_paper_scissors_plus(),
+        )
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'missing' / 'checkpoint.npz'
+            thread = solver.save_checkpoint(path, True)
+
+            assert thread is not None
+
+            self.assertRaises(FileNotFoundError, thread.join)
+
+            solver.save_checkpoint(path, True)
+
+            self.assertRaises(
+                FileNotFoundError,
+                solver.save_checkpoint,
+                Path(directory) / 'checkpoint.npz',
+            )
+            solver.save_checkpoint(Path(directory) / 'checkpoint.npz')
+
+    def test_warm_start(self) -> None:
+        game = create_kuhn_poker()
+        solver = CounterfactualRegretMinimization(game)
+
+        solver.solve(100)
+
+        counterfactual_regrets = dict(
+            zip(
+                solver.actions,
+                _asnumpy(solver._average_counterfactual_regrets) * 100,
+            ),
+        )
+        warm_solver = CounterfactualRegretMinimization(game)
+
+        self.assertRaises(ValueError, warm_solver.warm_start)
+        warm_solver.warm_start(
+            counterfactual_regrets=counterfactual_regrets,
+            iteration_count=100,
+        )
+        assert_allclose(
+            _asnumpy(warm_solver._strategy_profile),
+            _asnumpy(solver._strategy_profile),
+        )
+        self.assertGreater(warm_solver.get_exploitability(), 0)
+        self.assertAlmostEqual(
+            warm_solver.get_exploitability(),
+            warm_solver.get_exploitability(False),
+        )
+
+        exploitability = warm_solver.get_exploitability()
+
+        warm_solver.solve(100)
+
+        self.assertLess(warm_solver.get_exploitability(), exploitability)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
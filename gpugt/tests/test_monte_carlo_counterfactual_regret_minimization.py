@@ -0,0 +1,85 @@
+from unittest import main, TestCase
+import warnings
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+
+    from gpugt.algorithms.monte_carlo_counterfactual_regret_minimization \
+        import MonteCarloCounterfactualRegretMinimization, Sampling
+
+from gpugt.games.pokerkit import create_kuhn_poker
+
+
+class MonteCarloCounterfactualRegretMinimizationTestCase(TestCase):
+    def test_convergence(self) -> None:
+        game = create_kuhn_poker()
+        exploitabilities = {
+            Sampling.EXTERNAL: 0.08,
+            Sampling.OUTCOME: 0.2,
+            Sampling.CHANCE: 0.08,
+        }
+
+        for sampling, exploitability in exploitabilities.items():
+            with self.subTest(sampling=sampling):
+                solver = MonteCarloCounterfactualRegretMinimization(
+                    game,
+                    sampling=sampling,
+                    seed=0,
+                )
+
+                solver.solve(2000)
+
+                self.assertLess(solver.get_exploitability(), exploitability)
+
+    def test_warm_start(self) -> None:
+        game = create_kuhn_poker()
+
+        for sampling in Sampling:
+            with self.subTest(sampling=sampling):
+                solver = MonteCarloCounterfactualRegretMinimization(
+                    game,
+                    sampling=sampling,
+                    seed=0,
+                )
+
+                for _ in range(20):
+                    solver.iterate()
+
+                average_strategy_profile = dict(
+                    solver.average_strategy_profile,
+                )
+                strategy_profile = dict(solver.strategy_profile)
+                warm_solver = MonteCarloCounterfactualRegretMinimization(
+                    game,
+                    sampling=sampling,
+                    seed=0,
+                )
+
+                warm_solver.warm_start(
+                    average_strategy_profile=average_strategy_profile,
+                    strategy_profile=lambda node, action: strategy_profile[
+                        game.information_partition[node],
+                        action,
+                    ],
+                    iteration_count=10,
+                )
+
+                for key, probability in average_strategy_profile.items():
+                    self.assertAlmostEqual(
+                        warm_solver.average_strategy_profile[key],
+                        probability,
+                    )
+
+                for key, probability in strategy_profile.items():
+                    self.assertAlmostEqual(
+                        warm_solver.strategy_profile[key],
+                        probability,
+                    )
+
+                warm_solver.iterate()
+
+                self.assertLess(warm_solver.get_exploitability(), 0.5)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
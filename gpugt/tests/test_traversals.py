@@ -0,0 +1,76 @@
+from collections.abc import Iterator
+from sys import getrecursionlimit
+from unittest import main, TestCase
+
+from gpugt.graphs.traversals import level_order, post_order, pre_order
+
+_TREE = {
+    'a': ('b', 'c', 'd'),
+    'b': ('e', 'f'),
+    'd': ('g',),
+    'f': ('h', 'i'),
+}
+
+
+def _get_children(node: str) -> tuple[str, ...]:
+    return _TREE.get(node, ())
+
+
+class TraversalsTestCase(TestCase):
+    def test_pre_order(self) -> None:
+        self.assertEqual(
+            ''.join(pre_order('a', _get_children)),
+            'abefhicdg',
+        )
+        self.assertEqual(list(pre_order('c', _get_children)), ['c'])
+
+    def test_post_order(self) -> None:
+        self.assertEqual(
+            ''.join(post_order('a', _get_children)),
+            'ehifbcgda',
+        )
+        self.assertEqual(list(post_order('c', _get_children)), ['c'])
+
+    def test_level_order(self) -> None:
+        self.assertEqual(
+            ''.join(level_order('a', _get_children)),
+            'abcdefghi',
+        )
+        self.assertEqual(list(level_order('c', _get_children)), ['c'])
+
+    def test_laziness(self) -> None:
+        for traversal, order, first_expanded_nodes in (
+                (pre_order, 'abefhicdg', ''),
+                (post_order, 'ehifbcgda', 'abe'),
+                (level_order, 'abcdefghi', ''),
+        ):
+            with self.subTest(traversal=traversal):
+                expanded_nodes = []
+
+                def get_children(node: str) -> Iterator[str]:
+                    expanded_nodes.append(node)
+
+                    yield from _get_children(node)
+
+                nodes = traversal('a', get_children)
+
+                self.assertEqual(next(nodes), order[0])
+                self.assertEqual(''.join(expanded_nodes), first_expanded_nodes)
+                self.assertEqual(''.join(nodes), order[1:])
+                self.assertCountEqual(expanded_nodes, order)
+
+    def test_deep_chain(self) -> None:
+        depth = max(5000, 2 * getrecursionlimit())
+
+        def get_children(node: int) -> tuple[int, ...]:
+            return (node + 1,) if node < depth else ()
+
+        nodes = list(range(depth + 1))
+
+        self.assertEqual(list(pre_order(0, get_children)), nodes)
+        self.assertEqual(list(post_order(0, get_children)), nodes[::-1])
+        self.assertEqual(list(level_order(0, get_children)), nodes)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover